@@ -1,68 +1,20 @@
 import { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
-import type { CoursePageProps } from '../types/index';
-
-interface Lesson {
-  lesson_title: string;
-  thinking_method_focus: string[];
-  objective: string;
-  key_vocabulary: Array<{
-    word: string;
-    meaning: string;
-  }>;
-  turns: Array<{
-    turn_number: number;
-    section: string;
-    teacher_dialogue: string;
-    justification: string;
-  }>;
-}
-
-interface CourseData {
-  course_name: string;
-  part_name: string;
-  lessons_covered: string;
-  lessons: Lesson[];
-}
-
-interface Section {
-  part_name: string;
-  lessons: Lesson[];
-  startIndex: number; // zero-based index in global list
-}
+import type { CoursePageProps, CourseToc, CourseTocPart } from '../types/index';
 
 const CoursePage: React.FC<CoursePageProps> = () => {
   const [loading, setLoading] = useState(true);
   const [searchTerm, setSearchTerm] = useState('');
-  const [sections, setSections] = useState<Section[]>([]);
+  const [sections, setSections] = useState<CourseTocPart[]>([]);
 
   useEffect(() => {
     const loadLessons = async () => {
       try {
-        // Load new consolidated lesson parts (Part 1–6) and compute sections dynamically
-        const partFiles = ['part1', 'part2', 'part3', 'part4', 'part5', 'part6'];
-        const responses = await Promise.all(
-          partFiles.map((f) => fetch(`/data/lesson_data/${f}.json`))
-        );
-        responses.forEach((res, i) => {
-          if (!res.ok) {
-            throw new Error(`Failed to load ${partFiles[i]}`);
-          }
-        });
-        const parts: CourseData[] = await Promise.all(responses.map((r) => r.json()));
-
-        let runningIndex = 0;
-        const sectionsComputed: Section[] = parts.map((p) => {
-          const section: Section = {
-            part_name: p.part_name,
-            lessons: p.lessons,
-            startIndex: runningIndex,
-          };
-          runningIndex += p.lessons.length;
-          return section;
-        });
-
-        setSections(sectionsComputed);
+        // Prebuilt table of contents (tools/build_derived.py)
+        const tocRes = await fetch('/data/derived/course_toc.json');
+        if (!tocRes.ok) throw new Error('Failed to load course_toc');
+        const toc: CourseToc = await tocRes.json();
+        setSections(toc.parts);
       } catch (error) {
         console.error('Error loading lessons:', error);
       } finally {
@@ -85,7 +37,7 @@ const CoursePage: React.FC<CoursePageProps> = () => {
   const filteredSections = sections.map(section => ({
     ...section,
     lessons: section.lessons.filter(lesson =>
-      lesson.lesson_title.toLowerCase().includes(searchTerm.toLowerCase()) ||
+      lesson.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
       lesson.objective.toLowerCase().includes(searchTerm.toLowerCase()) ||
       lesson.thinking_method_focus.some(focus => focus.toLowerCase().includes(searchTerm.toLowerCase()))
     )
@@ -123,8 +75,9 @@ const CoursePage: React.FC<CoursePageProps> = () => {
             <div key={section.part_name} className="space-y-4">
               <h2 className="text-2xl font-bold text-gray-900 dark:text-white">{section.part_name}</h2>
               <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-                {section.lessons.map((lesson, idx) => {
-                  const lessonNumber = section.startIndex + idx + 1;
+                {section.lessons.map((lesson) => {
+                  const lessonNumber = lesson.number;
+                  const words = lesson.key_words;
                   return (
                     <Link
                       key={lessonNumber}
@@ -132,18 +85,18 @@ const CoursePage: React.FC<CoursePageProps> = () => {
                       className="block p-6 bg-white dark:bg-gray-800 rounded-lg shadow hover:shadow-md transition-shadow duration-200 border border-gray-200 dark:border-gray-700"
                     >
                       <h3 className="text-lg font-semibold text-indigo-600 dark:text-indigo-400 mb-2">
-                        {lesson.lesson_title.replace(/\*\*/g, '')}
+                        {lesson.title}
                       </h3>
                       <p className="text-sm text-gray-600 dark:text-gray-300 mb-3 line-clamp-2">
                         {lesson.objective}
                       </p>
-                      {lesson.key_vocabulary && lesson.key_vocabulary.length > 0 && (
+                      {words.length > 0 && (
                         <div className="mt-3">
                           <p className="text-xs font-medium text-gray-500 dark:text-gray-400 mb-1">
                             Key Vocabulary:
                           </p>
                           <p className="text-sm text-gray-600 dark:text-gray-300 line-clamp-2">
-                            {lesson.key_vocabulary.map(v => v.word).join(', ')}
+                            {words.join(', ')}
                           </p>
                         </div>
                       )}
@@ -1,62 +1,47 @@
 import { useEffect, useMemo, useState } from 'react';
 import { Link } from 'react-router-dom';
-import type { LessonPageProps } from '../types/index';
+import type { CourseToc, CourseTocLesson, CourseVocab, CourseVocabWord, LessonPageProps } from '../types/index';
 
 interface PracticeItem {
   prompt: string;
   answer: string;
 }
 
-interface LessonKVItem {
-  word: string;
-  meaning: string;
-}
-
-interface LessonRaw {
-  lesson_title: string;
-  thinking_method_focus: string[];
-  objective: string;
-  key_vocabulary?: LessonKVItem[];
-}
-
-interface PartData {
-  course_name: string;
-  part_name: string;
-  lessons_covered: string; // e.g. "1-10"
-  lessons: LessonRaw[];
-}
-
 type Mode = 'lesson' | 'part' | 'course';
 
-const partFiles = ['part1', 'part2', 'part3', 'part4', 'part5', 'part6'];
-
 const CourseVocabPage: React.FC<LessonPageProps> = () => {
-  const [parts, setParts] = useState<PartData[] | null>(null);
+  const [toc, setToc] = useState<CourseToc | null>(null);
+  const [vocab, setVocab] = useState<CourseVocab | null>(null);
   const [loading, setLoading] = useState(true);
 
   const [mode, setMode] = useState<Mode>('lesson');
   const [selectedLessonNumber, setSelectedLessonNumber] = useState<number>(1);
   const [selectedPartIndex, setSelectedPartIndex] = useState<number>(0); // 0-based
 
+  const parts = toc?.parts ?? null;
+
   const combinedLessons = useMemo(() => {
-    if (!parts) return [] as LessonRaw[];
+    if (!parts) return [] as CourseTocLesson[];
     return parts.flatMap((p) => p.lessons);
   }, [parts]);
 
   useEffect(() => {
-    const loadAllParts = async () => {
+    const loadVocab = async () => {
       try {
         setLoading(true);
-        const responses = await Promise.all(
-          partFiles.map((f) => fetch(`/data/lesson_data/${f}.json`))
-        );
-        responses.forEach((res, i) => {
-          if (!res.ok) throw new Error(`Failed to load ${partFiles[i]}`);
-        });
-        const data: PartData[] = await Promise.all(responses.map((r) => r.json()));
-        setParts(data);
+        // Prebuilt table of contents and vocabulary (tools/build_derived.py)
+        const [tocRes, vocabRes] = await Promise.all([
+          fetch('/data/derived/course_toc.json'),
+          fetch('/data/derived/course_vocab.json'),
+        ]);
+        if (!tocRes.ok) throw new Error('Failed to load course_toc');
+        if (!vocabRes.ok) throw new Error('Failed to load course_vocab');
+        const tocData: CourseToc = await tocRes.json();
+        const vocabData: CourseVocab = await vocabRes.json();
+        setToc(tocData);
+        setVocab(vocabData);
         // Initialize selections
-        const firstWithLessons = data.findIndex((p) => (p.lessons?.length ?? 0) > 0);
+        const firstWithLessons = tocData.parts.findIndex((p) => (p.lessons?.length ?? 0) > 0);
         setSelectedPartIndex(firstWithLessons >= 0 ? firstWithLessons : 0);
         setSelectedLessonNumber(1);
       } catch (e) {
@@ -65,39 +50,36 @@ const CourseVocabPage: React.FC<LessonPageProps> = () => {
         setLoading(false);
       }
     };
-    loadAllParts();
+    loadVocab();
   }, []);
 
   // Build practice items based on mode/selection
   const items: PracticeItem[] = useMemo(() => {
-    if (!parts || parts.length === 0) return [];
-
-    const toPracticeItems = (kv: LessonKVItem[], fromLabel?: string): PracticeItem[] =>
-      kv
-        .filter((k) => k.word && k.meaning)
-        .map((k) => ({
-          prompt: `“${k.meaning}”` + (fromLabel ? '' : ''),
-          answer: k.word.trim(),
+    if (!parts || parts.length === 0 || !vocab) return [];
+
+    const toPracticeItems = (words: CourseVocabWord[]): PracticeItem[] =>
+      words
+        .filter((w) => w.word && w.meanings.length > 0)
+        .map((w) => ({
+          prompt: `“${w.meanings.join('; ')}”`,
+          answer: w.word.trim(),
         }));
 
     if (mode === 'lesson') {
       if (selectedLessonNumber < 1 || selectedLessonNumber > combinedLessons.length) return [];
-      const lesson = combinedLessons[selectedLessonNumber - 1];
-      const kv = lesson?.key_vocabulary ?? [];
-      return toPracticeItems(kv);
+      return toPracticeItems(vocab.words.filter((w) => w.lessons.includes(selectedLessonNumber)));
     }
 
     if (mode === 'part') {
       const part = parts[selectedPartIndex];
       if (!part) return [];
-      const allKV = part.lessons.flatMap((l) => l.key_vocabulary ?? []);
-      return toPracticeItems(allKV, part.part_name);
+      const numbers = new Set(part.lessons.map((l) => l.number));
+      return toPracticeItems(vocab.words.filter((w) => w.lessons.some((n) => numbers.has(n))));
     }
 
     // Entire course
-    const allKV = parts.flatMap((p) => p.lessons.flatMap((l) => l.key_vocabulary ?? []));
-    return toPracticeItems(allKV, 'Entire Course');
-  }, [parts, combinedLessons, mode, selectedLessonNumber, selectedPartIndex]);
+    return toPracticeItems(vocab.words);
+  }, [parts, vocab, combinedLessons, mode, selectedLessonNumber, selectedPartIndex]);
 
   // Reset card index and answer when items change
   const [currentIndex, setCurrentIndex] = useState(0);
@@ -127,7 +109,7 @@ const CourseVocabPage: React.FC<LessonPageProps> = () => {
   const lessonOptions = useMemo(() => {
     return combinedLessons.map((l, idx) => {
       const n = idx + 1;
-      const title = l.lesson_title?.replace(/\*\*/g, '').trim() || `Lesson ${n}`;
+      const title = l.title || `Lesson ${n}`;
       return { value: n, label: `${n}. ${title}` };
     });
   }, [combinedLessons]);
@@ -145,7 +127,7 @@ const CourseVocabPage: React.FC<LessonPageProps> = () => {
     );
   }
 
-  if (!parts) {
+  if (!parts || !vocab) {
     return (
       <div className="min-h-screen bg-white dark:bg-gray-900 pt-20 px-4">
         <div className="max-w-4xl mx-auto">
@@ -247,7 +229,7 @@ const CourseVocabPage: React.FC<LessonPageProps> = () => {
               <div className="p-6">
                 {mode === 'lesson' && (
                   <div className="mb-2 text-sm font-medium text-indigo-600 dark:text-indigo-400">
-                    {combinedLessons[selectedLessonNumber - 1]?.lesson_title?.replace(/\*\*/g, '')}
+                    {combinedLessons[selectedLessonNumber - 1]?.title}
                   </div>
                 )}
                 {mode === 'part' && (
@@ -1,11 +1,10 @@
 import React, { useState, useEffect, useMemo, useCallback } from 'react';
 import DictionaryFilters from '../components/DictionaryFilters';
 import TextFilters from '../components/TextFilters';
-import useSanitizeText from '../hooks/useSanitizeText';
+import toSearchKey from '../utils/searchKey';
 import type { DictionaryEntry, TextEntry, DictionaryPageProps } from '../types/index';
 
 const DictionaryPage: React.FC<DictionaryPageProps> = ({ isDarkMode }) => {
-  const sanitizeText = useSanitizeText();
   const [mode] = useState<'dictionary' | 'texts'>('dictionary');
   const [searchTerm, setSearchTerm] = useState('');
   const [selectedDeck, setSelectedDeck] = useState<string>('all');
@@ -21,7 +20,8 @@ const DictionaryPage: React.FC<DictionaryPageProps> = ({ isDarkMode }) => {
     const loadData = async () => {
       try {
         console.log('Loading dictionary data...');
-        const dictResponse = await fetch('/data/Xhosa_notes.json');
+        // Pre-sanitized by tools/sanitize_data.py
+        const dictResponse = await fetch('/data/sanitized/Xhosa_notes.json');
         console.log('Dictionary response status:', dictResponse.status);
         if (!dictResponse.ok) {
           throw new Error(`Failed to load dictionary data: ${dictResponse.statusText}`);
@@ -55,19 +55,20 @@ const DictionaryPage: React.FC<DictionaryPageProps> = ({ isDarkMode }) => {
 
   // Get filtered entries based on current mode and filters
   const filteredEntries = useMemo(() => {
+    const key = toSearchKey(searchTerm);
+    // Match against the precomputed search fields
+    const matchesSearch = (entry: DictionaryEntry | TextEntry) => key === '' ||
+      (entry.xh_search?.includes(key) ?? false) ||
+      (entry.en_search?.includes(key) ?? false) ||
+      (entry.en_context_search?.includes(key) ?? false);
+
     if (mode === 'dictionary') {
       return dictionary.filter(entry => {
         // Check if entry matches the selected deck filter
         const matchesDeck = selectedDeck === 'all' || 
           (entry.deck && entry.deck.includes(selectedDeck));
         
-        // Check if entry matches the search term
-        const matchesSearch = searchTerm === '' || 
-          (entry.xh && entry.xh.toLowerCase().includes(searchTerm.toLowerCase())) ||
-          (entry.en && entry.en.toLowerCase().includes(searchTerm.toLowerCase())) ||
-          (entry.en_context && entry.en_context.toLowerCase().includes(searchTerm.toLowerCase()));
-        
-        return matchesDeck && matchesSearch;
+        return matchesDeck && matchesSearch(entry);
       });
     } else {
       return texts.filter(entry => {
@@ -76,35 +77,18 @@ const DictionaryPage: React.FC<DictionaryPageProps> = ({ isDarkMode }) => {
         const matchesText = selectedText === 'all' || 
           (deckName && deckName === selectedText);
         
-        // Check if entry matches the search term
-        const matchesSearch = searchTerm === '' ||
-          (entry.xh && entry.xh.toLowerCase().includes(searchTerm.toLowerCase())) ||
-          (entry.en && entry.en.toLowerCase().includes(searchTerm.toLowerCase())) ||
-          (entry.en_context && entry.en_context.toLowerCase().includes(searchTerm.toLowerCase()));
-        
-        return matchesText && matchesSearch;
+        return matchesText && matchesSearch(entry);
       });
     }
   }, [dictionary, texts, mode, searchTerm, selectedDeck, selectedText]);
 
-  // Process entries for display
-  const processedEntries = useMemo(() => {
-    return filteredEntries.map(entry => ({
-      ...entry,
-      xh: sanitizeText(entry.xh),
-      en: sanitizeText(entry.en),
-      en_context: entry.en_context ? sanitizeText(entry.en_context) : undefined,
-      xh_context: entry.xh_context ? sanitizeText(entry.xh_context) : undefined
-    }));
-  }, [filteredEntries, sanitizeText]);
-
   // Pagination
-  const totalPages = Math.ceil(processedEntries.length / entriesPerPage);
+  const totalPages = Math.ceil(filteredEntries.length / entriesPerPage);
   const currentEntries = useMemo(() => {
     const startIdx = (currentPage - 1) * entriesPerPage;
     const endIdx = startIdx + entriesPerPage;
-    return processedEntries.slice(startIdx, endIdx);
-  }, [processedEntries, currentPage, entriesPerPage]);
+    return filteredEntries.slice(startIdx, endIdx);
+  }, [filteredEntries, currentPage, entriesPerPage]);
 
   const handlePageChange = useCallback((newPage: number) => {
     setCurrentPage(newPage);
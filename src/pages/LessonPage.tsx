@@ -46,10 +46,10 @@ const LessonPage: React.FC<LessonPageProps> = () => {
     const loadLesson = async () => {
       try {
         setLoading(true);
-        // Load consolidated parts (Part 1–6) and merge
+        // Load consolidated, pre-sanitized parts (Part 1–6) and merge
         const partFiles = ['part1', 'part2', 'part3', 'part4', 'part5', 'part6'];
         const responses = await Promise.all(
-          partFiles.map((f) => fetch(`/data/lesson_data/${f}.json`))
+          partFiles.map((f) => fetch(`/data/sanitized/lesson_data/${f}.json`))
         );
         responses.forEach((res, i) => {
           if (!res.ok) {
@@ -206,7 +206,7 @@ const LessonPage: React.FC<LessonPageProps> = () => {
             // Start screen
             <div className="text-center py-16">
               <h1 className="text-3xl font-bold text-gray-900 dark:text-white mb-6">
-                {lesson.lesson_title.replace(/\*\*/g, '')}
+                {lesson.lesson_title}
               </h1>
               <div className="prose dark:prose-invert max-w-none text-lg text-gray-600 dark:text-gray-300 mb-8">
                 <ReactMarkdown remarkPlugins={[remarkGfm]}>
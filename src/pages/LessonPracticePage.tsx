@@ -52,10 +52,10 @@ const LessonPracticePage: React.FC<LessonPageProps> = () => {
     const loadLesson = async () => {
       try {
         setLoading(true);
-        // Load consolidated lesson parts (Part 1–6)
+        // Load consolidated, pre-sanitized lesson parts (Part 1–6)
         const partFiles = ['part1', 'part2', 'part3', 'part4', 'part5', 'part6'];
         const responses = await Promise.all(
-          partFiles.map((f) => fetch(`/data/lesson_data/${f}.json`))
+          partFiles.map((f) => fetch(`/data/sanitized/lesson_data/${f}.json`))
         );
         responses.forEach((res, i) => {
           if (!res.ok) throw new Error(`Failed to load ${partFiles[i]}`);
@@ -154,7 +154,7 @@ const LessonPracticePage: React.FC<LessonPageProps> = () => {
           <h1 className="text-2xl font-bold text-gray-900 dark:text-white mb-4">Practice</h1>
           <div className="bg-white dark:bg-gray-800 rounded-xl shadow-md overflow-hidden">
             <div className="p-6">
-              <div className="mb-2 text-sm font-medium text-indigo-600 dark:text-indigo-400">{lesson.lesson_title.replace(/\*\*/g, '')}</div>
+              <div className="mb-2 text-sm font-medium text-indigo-600 dark:text-indigo-400">{lesson.lesson_title}</div>
 
               <div className="min-h-40 md:min-h-48 p-6 border border-gray-200 dark:border-gray-700 rounded-lg bg-gray-50 dark:bg-gray-900/30 flex items-center justify-center text-center">
                 {!showAnswer ? (
@@ -1,13 +1,12 @@
 import React, { useState, useEffect, useMemo } from 'react';
 import type { TextEntry } from '../types/index';
-import useSanitizeText from '../hooks/useSanitizeText';
+import toSearchKey from '../utils/searchKey';
 
 const TextsPage: React.FC = () => {
   const [searchTerm, setSearchTerm] = useState('');
   const [texts, setTexts] = useState<TextEntry[]>([]);
   const [showEnglishFirst, setShowEnglishFirst] = useState(true);
   const [selectedText, setSelectedText] = useState<string>('all');
-  const sanitizeText = useSanitizeText();
   
   // Default deck to show if available
   const defaultDeck = "Xhosa Texts::Nkosi sikelel' iAfrika";
@@ -17,7 +16,8 @@ const TextsPage: React.FC = () => {
     const loadTexts = async () => {
       try {
         console.log('Loading texts data...');
-        const response = await fetch('/data/Xhosa_texts.json');
+        // Pre-sanitized by tools/sanitize_data.py
+        const response = await fetch('/data/sanitized/Xhosa_texts.json');
         if (!response.ok) {
           throw new Error(`Failed to load texts: ${response.statusText}`);
         }
@@ -58,28 +58,22 @@ const TextsPage: React.FC = () => {
     return decksArray;
   }, [texts, defaultDeck, selectedText]);
 
-  // Filter and sanitize texts based on search and selected text
+  // Filter texts based on search and selected text
   const filteredTexts = useMemo(() => {
-    return texts.map(entry => ({
-      ...entry,
-      xh: sanitizeText(entry.xh),
-      en: sanitizeText(entry.en),
-      xh_context: entry.xh_context ? sanitizeText(entry.xh_context) : undefined,
-      en_context: entry.en_context ? sanitizeText(entry.en_context) : undefined,
-      tag: entry.tag ? sanitizeText(entry.tag) : undefined,
-      deck: entry.deck ? sanitizeText(entry.deck) : undefined
-    })).filter(entry => {
+    const key = toSearchKey(searchTerm);
+    return texts.filter(entry => {
       const deckName = entry.deck ? entry.deck.split('::').pop() : '';
       const matchesText = selectedText === 'all' || (deckName && deckName === selectedText);
       
-      const matchesSearch = searchTerm === '' ||
-        (entry.xh && entry.xh.toLowerCase().includes(searchTerm.toLowerCase())) ||
-        (entry.en && entry.en.toLowerCase().includes(searchTerm.toLowerCase())) ||
-        (entry.en_context && entry.en_context.toLowerCase().includes(searchTerm.toLowerCase()));
+      // Match against the precomputed search fields
+      const matchesSearch = key === '' ||
+        (entry.xh_search?.includes(key) ?? false) ||
+        (entry.en_search?.includes(key) ?? false) ||
+        (entry.en_context_search?.includes(key) ?? false);
       
       return matchesText && matchesSearch;
     });
-  }, [texts, searchTerm, selectedText, sanitizeText]);
+  }, [texts, searchTerm, selectedText]);
 
 
   return (
@@ -8,6 +8,10 @@ export interface DictionaryEntry {
   xh_context?: string;
   tag: string;
   showEnglishFirst?: boolean;
+  // Precomputed by tools/sanitize_data.py
+  xh_search?: string;
+  en_search?: string;
+  en_context_search?: string;
 }
 
 export interface TextEntry {
@@ -18,6 +22,10 @@ export interface TextEntry {
   xh: string;
   xh_context: string;
   tag: string;
+  // Precomputed by tools/sanitize_data.py
+  xh_search?: string;
+  en_search?: string;
+  en_context_search?: string;
 }
 
 export type GroupedTexts = {
@@ -66,6 +74,37 @@ export interface LessonDetail {
   };
 }
 
+// Derived course data (built by tools/build_derived.py)
+export interface CourseTocLesson {
+  number: number;
+  title: string;
+  objective: string;
+  thinking_method_focus: string[];
+  key_words: string[];
+}
+
+export interface CourseTocPart {
+  part_name: string;
+  lessons_covered: string;
+  lessons: CourseTocLesson[];
+}
+
+export interface CourseToc {
+  lesson_count: number;
+  parts: CourseTocPart[];
+}
+
+export interface CourseVocabWord {
+  word: string;
+  meanings: string[];
+  lessons: number[];
+}
+
+export interface CourseVocab {
+  word_count: number;
+  words: CourseVocabWord[];
+}
+
 // Component props
 export interface DarkModeProps {
   isDarkMode: boolean;
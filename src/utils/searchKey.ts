@@ -0,0 +1,16 @@
+/**
+ * Normalizes a search term the same way tools/sanitize_data.py builds the
+ * precomputed `*_search` fields, so terms can be matched against them directly.
+ * @param term The raw search input
+ * @returns The casefolded term with punctuation dropped and spaces collapsed
+ */
+const toSearchKey = (term: string): string =>
+  term
+    .replace(/’/g, "'")
+    .toLowerCase()
+    .replace(/[^\p{L}\p{N}_\s'-]/gu, ' ')
+    .replace(/\s+/g, ' ')
+    .trim()
+    .normalize('NFC');
+
+export default toSearchKey;
@@ -0,0 +1,180 @@
+# Socratic Xhosa - Derived Artifact Builder
+# Run: python tools/build_derived.py [--force]
+#
+# Emits two compact files into public/data/derived/ so pages don't have to
+# download every lesson part:
+#   course_toc.json   - parts with lessons_covered and, per lesson, the global
+#                       number, clean title, objective, thinking_method_focus
+#                       and key words in lesson order
+#   course_vocab.json - deduplicated key_vocabulary, sorted by word, with the
+#                       lessons that introduce each word
+#
+# Each part is extracted once and cached by its file hash in tools/.cache/;
+# the artifacts are only rebuilt when a source part has changed. `npm run dev`
+# and `npm run build` run this first (via tools/prepare_data.mjs), and the
+# lesson/practice editors rerun it after every save, so the site always serves
+# current files.
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+from sanitize_data import LESSON_FILES, PIPELINE_VERSION, clean_display, clean_search
+
+BUILD_VERSION = 3
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+LESSON_DIR = ROOT_DIR / 'public' / 'data' / 'lesson_data'
+OUT_DIR = ROOT_DIR / 'public' / 'data' / 'derived'
+TOC_NAME = 'course_toc.json'
+VOCAB_NAME = 'course_vocab.json'
+# Kept out of public/ so the manifest is never deployed with the site
+MANIFEST_PATH = ROOT_DIR / 'tools' / '.cache' / 'derived_manifest.json'
+
+
+def file_hash(path: Path) -> str:
+    # Extracts hold cleaned text, so a change to the cleaning rules must rebuild them too
+    h = hashlib.sha1(f'v{BUILD_VERSION}.{PIPELINE_VERSION}:'.encode('ascii'))
+    h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+# ---------------------- Per-part extraction ----------------------
+def extract_part(data: dict) -> dict:
+    # Lesson numbers are local here; they are made global when assembling
+    lessons = []
+    vocab = []
+    for local_idx, lesson in enumerate(data.get('lessons', [])):
+        title = lesson.get('lesson_title') or lesson.get('title') or ''
+        kv = [item for item in lesson.get('key_vocabulary') or [] if isinstance(item, dict)]
+        key_words = []
+        for item in kv:
+            word = clean_display(item.get('word'))
+            if not word:
+                continue
+            if word not in key_words:
+                key_words.append(word)
+            vocab.append({
+                'word': word,
+                'meaning': clean_display(item.get('meaning')),
+                'local_idx': local_idx,
+            })
+        lessons.append({
+            'title': clean_display(title, title=True),
+            'objective': clean_display(lesson.get('objective')),
+            'thinking_method_focus': [clean_display(f) for f in lesson.get('thinking_method_focus') or [] if f],
+            'key_words': key_words,
+        })
+    return {
+        'part_name': clean_display(data.get('part_name'), title=True),
+        'lessons_covered': str(data.get('lessons_covered', '') or ''),
+        'lessons': lessons,
+        'vocab': vocab,
+    }
+
+
+# ---------------------- Assembly ----------------------
+def assemble(parts: list) -> tuple:
+    toc_parts = []
+    by_key = {}
+    global_num = 1
+    for part in parts:
+        start = global_num
+        toc_lessons = []
+        for lesson in part['lessons']:
+            toc_lessons.append({'number': global_num, **lesson})
+            global_num += 1
+        toc_parts.append({
+            'part_name': part['part_name'],
+            'lessons_covered': part['lessons_covered'],
+            'lessons': toc_lessons,
+        })
+
+        for item in part['vocab']:
+            key = clean_search(item['word'])
+            entry = by_key.get(key)
+            if entry is None:
+                entry = {'word': item['word'], 'meanings': [], 'lessons': []}
+                by_key[key] = entry
+            if item['meaning'] and item['meaning'] not in entry['meanings']:
+                entry['meanings'].append(item['meaning'])
+            lesson_num = start + item['local_idx']
+            if lesson_num not in entry['lessons']:
+                entry['lessons'].append(lesson_num)
+
+    vocab = [by_key[k] for k in sorted(by_key)]
+    toc = {'lesson_count': global_num - 1, 'parts': toc_parts}
+    return toc, {'word_count': len(vocab), 'words': vocab}
+
+
+# ---------------------- Build ----------------------
+def _load_manifest(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    try:
+        with path.open('r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def build(force: bool = False, out_dir: Path = OUT_DIR, manifest_path: Path = MANIFEST_PATH):
+    """Rebuild the derived artifacts if any source part changed.
+
+    Returns (rebuilt, reparsed_files).
+    """
+    manifest = {} if force else _load_manifest(manifest_path)
+    cached_parts = manifest.get('parts', {})
+
+    new_parts = {}
+    extracted = []
+    reparsed = []
+    for fname in LESSON_FILES:
+        src = LESSON_DIR / fname
+        if not src.exists():
+            print(f'Missing file: {src}')
+            continue
+        digest = file_hash(src)
+        cached = cached_parts.get(fname)
+        if cached and cached.get('hash') == digest:
+            part = cached['extract']
+        else:
+            with src.open('r', encoding='utf-8') as f:
+                part = extract_part(json.load(f))
+            reparsed.append(fname)
+        new_parts[fname] = {'hash': digest, 'extract': part}
+        extracted.append(part)
+
+    outputs_exist = (out_dir / TOC_NAME).exists() and (out_dir / VOCAB_NAME).exists()
+    if not reparsed and outputs_exist and list(new_parts) == list(cached_parts):
+        return False, reparsed
+
+    toc, vocab = assemble(extracted)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with (out_dir / TOC_NAME).open('w', encoding='utf-8') as f:
+        json.dump(toc, f, ensure_ascii=False, indent=2)
+    with (out_dir / VOCAB_NAME).open('w', encoding='utf-8') as f:
+        json.dump(vocab, f, ensure_ascii=False, indent=2)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    with manifest_path.open('w', encoding='utf-8') as f:
+        json.dump({'parts': new_parts}, f, ensure_ascii=False)
+    return True, reparsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the course TOC and vocabulary table.')
+    parser.add_argument('--force', action='store_true', help='rebuild even if no part has changed')
+    args = parser.parse_args()
+
+    rebuilt, reparsed = build(force=args.force)
+    if not rebuilt:
+        print('Derived artifacts are up to date')
+        return
+    if reparsed:
+        print('Reparsed: ' + ', '.join(reparsed))
+    print(f'Wrote derived/{TOC_NAME} and derived/{VOCAB_NAME}')
+
+
+if __name__ == '__main__':
+    main()
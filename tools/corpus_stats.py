@@ -0,0 +1,415 @@
+# Socratic Xhosa - Corpus Statistics and Coverage Report
+# Run: python tools/corpus_stats.py [--out PATH] [--top N] [--untaught]
+# Requires numpy (pip install numpy)
+#
+# Tokenizes the isiXhosa in every lesson turn and practice item once into a
+# token-ID array, then uses vectorized counting to report per-lesson new
+# words, which dictionary Vocabulary-deck words the course teaches (and where
+# each is first taught), and word frequency distributions. Writes a Markdown
+# report for the curriculum team to reports/, outside the deployed site.
+#
+# Which text counts as isiXhosa follows the orthography checker: **bold**
+# spans of teacher dialogue, all of student dialogue and practice answers,
+# skipping tokens that are only known as English and affix citations (-nga-). Lesson words are matched to
+# dictionary headwords exactly, through a noun stem with a prefix of the same
+# noun class (abafazi -> umfazi), or through the checker's verb splitting for
+# "-stem" headwords (ndiyafuna -> -funa). Each lesson's key_vocabulary also
+# counts as taught in that lesson; affix entries such as `-wa (passive)` only
+# count when they match a headword exactly.
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from sanitize_data import LESSON_FILES, clean_display
+from orthography import (
+    DATA_DIR, LESSON_DIR, MIN_STEM, NOTES_FILE, ROOT_DIR, VOWELS,
+    LexiconTrie, OrthographyChecker, build_checker, normalize_word, tokenize, xhosa_segments,
+)
+
+OUT_PATH = ROOT_DIR / 'reports' / 'corpus_report.md'
+VOCAB_DECK = 'Xhosa::Vocabulary'
+FREQ_BANDS = (1, 2, 5, 10, 25, 100)
+# Noun class / infinitive prefixes by singular-plural pairing. A headword's
+# stem (umfazi -> fazi) only matches a lesson word whose own prefix is in the
+# same pairing (abafazi), never a verbal concord chain (ndiyaqala is not umqala)
+NOUN_CLASSES = (
+    ('umu', 'um', 'aba', 'abe'),        # 1/2
+    ('u', 'oo'),                        # 1a/2a
+    ('umu', 'um', 'imi'),               # 3/4
+    ('ili', 'i', 'ama'),                # 5/6
+    ('isi', 'izi'),                     # 7/8
+    ('in', 'im', 'i', 'izin', 'izim', 'iin', 'iim', 'ii'),  # 9/10
+    ('ulu', 'u'),                       # 11
+    ('ubu',),                           # 14
+    ('uku', 'ukw'),                     # 15
+)
+NOUN_PREFIXES = tuple(sorted({p for group in NOUN_CLASSES for p in group}))
+# Noun stems, and verb stems reached by undoing an ending, shorter than this
+# are too ambiguous to count
+STEM_FORM_MIN = 4
+
+
+# ---------------------- Corpus ----------------------
+class Corpus:
+    """Token IDs for the whole course, with the lesson index of each token."""
+
+    def __init__(self):
+        self.vocab = {}        # word -> id
+        self.words = []        # id -> word
+        self.lesson_titles = []
+        self.key_vocab = []    # (lesson_idx, word, exact) from each lesson's key_vocabulary
+        self._ids = []
+        self._lessons = []
+        self.ids = None        # np.int32 array, built by freeze()
+        self.lesson_ids = None
+
+    def add_lesson(self, title: str, tokens, key_words=()):
+        lesson_idx = len(self.lesson_titles)
+        self.lesson_titles.append(title)
+        self.key_vocab.extend((lesson_idx, word, exact) for word, exact in key_words)
+        vocab = self.vocab
+        for token in tokens:
+            word_id = vocab.get(token)
+            if word_id is None:
+                word_id = vocab[token] = len(self.words)
+                self.words.append(token)
+            self._ids.append(word_id)
+        self._lessons.extend([lesson_idx] * (len(self._ids) - len(self._lessons)))
+
+    def freeze(self):
+        self.ids = np.asarray(self._ids, dtype=np.int32)
+        self.lesson_ids = np.asarray(self._lessons, dtype=np.int32)
+        self._ids, self._lessons = [], []
+        return self
+
+    @property
+    def n_words(self):
+        return len(self.words)
+
+    @property
+    def n_lessons(self):
+        return len(self.lesson_titles)
+
+
+def lesson_tokens(lesson: dict, english):
+    for turn in lesson.get('turns') or []:
+        for key, scope in (('teacher_dialogue', 'bold'), ('student_dialogue', 'all')):
+            text = turn.get(key)
+            if text:
+                yield from _xhosa_tokens(str(text), scope, english)
+    for item in lesson.get('practice') or []:
+        if isinstance(item, dict) and item.get('answer'):
+            yield from _xhosa_tokens(str(item['answer']), 'all', english)
+
+
+def lesson_key_words(lesson: dict, english):
+    """Yield (word, exact) for a lesson's key_vocabulary.
+
+    Affixes and annotated entries ('-wa (passive)', 'Ma- (hortative)') are
+    kept whole and only ever matched exactly; plain words are tokenized.
+    """
+    for item in lesson.get('key_vocabulary') or []:
+        if not (isinstance(item, dict) and item.get('word')):
+            continue
+        word = clean_display(item['word'])
+        if '-' in word or '(' in word:
+            yield word, True
+        else:
+            yield from ((token, False) for token in _xhosa_tokens(word, 'all', english))
+
+
+def _xhosa_tokens(text: str, scope: str, english):
+    for line in text.split('\n'):
+        for _, segment in xhosa_segments(line, scope):
+            for _, _, token in tokenize(segment):
+                if token.startswith('-') or token.endswith('-'):
+                    continue  # affix citations such as -nga- are grammar, not running text
+                word = normalize_word(token)
+                if len(word) > 1 and word not in english:
+                    yield word
+
+
+def load_corpus(lesson_dir: Path = LESSON_DIR, english=frozenset()) -> Corpus:
+    corpus = Corpus()
+    for fname in LESSON_FILES:
+        path = lesson_dir / fname
+        if not path.exists():
+            print(f'Missing file: {path}')
+            continue
+        with path.open('r', encoding='utf-8') as f:
+            data = json.load(f)
+        for lesson in data.get('lessons', []):
+            title = clean_display(lesson.get('lesson_title') or lesson.get('title'), title=True)
+            corpus.add_lesson(title, lesson_tokens(lesson, english), lesson_key_words(lesson, english))
+    return corpus.freeze()
+
+
+def _exact_key(text: str) -> str:
+    # Unlike normalize_word this keeps hyphens: '-sa-' is not '-sa'
+    return ' '.join(text.replace('’', "'").casefold().split())
+
+
+class Dictionary:
+    """Single-word Vocabulary-deck headwords, indexed by headword and stem."""
+
+    def __init__(self):
+        self.entries = []      # id -> {'word', 'meaning'}
+        self._exact = {}       # headword as written, casefolded -> id
+        self._words = {}       # full-word headword -> id
+        self._stem_ids = {}    # '-stem' headword -> id
+        self._verbs = set()    # ids of '-stem' headwords glossed 'to ...'
+        self.noun_stems = LexiconTrie()
+        self._noun_ids = {}    # noun stem -> [(id, prefixes allowed before it)]
+        # No shared-vowel splits: b-ona would make every bona form count as -ona
+        self.matcher = OrthographyChecker(LexiconTrie(), stems=LexiconTrie(), coalesce='')
+
+    def add(self, word: str, meaning: str):
+        exact = _exact_key(word)
+        if len(normalize_word(word)) < 2 or exact in self._exact:
+            return
+        self._exact[exact] = len(self.entries)
+        self.entries.append({'word': word, 'meaning': meaning})
+
+    def index(self):
+        for entry_id, entry in enumerate(self.entries):
+            key = normalize_word(entry['word'])
+            if entry['word'].endswith('-'):
+                continue  # affixes such as '-ku-' only match exactly
+            if entry['word'].startswith('-'):
+                self._stem_ids.setdefault(key, entry_id)
+                self.matcher.stems.add(key)
+                if entry['meaning'].casefold().startswith('to '):
+                    self._verbs.add(entry_id)
+                continue
+            self._words.setdefault(key, entry_id)
+            for group in NOUN_CLASSES:
+                for prefix in group:
+                    if key.startswith(prefix) and len(key) - len(prefix) >= STEM_FORM_MIN:
+                        stem = key[len(prefix):]
+                        self.noun_stems.add(stem)
+                        self._noun_ids.setdefault(stem, []).append((entry_id, group))
+        return self
+
+    def lookup_exact(self, text: str) -> int:
+        """Return the entry id whose headword is written exactly as text, or -1."""
+        return self._exact.get(_exact_key(text), -1)
+
+    def lookup(self, word: str) -> int:
+        """Return the entry id a lesson word belongs to, or -1."""
+        entry_id = self._words.get(word)
+        if entry_id is None and word[:1] in VOWELS:
+            # Copulative/locative initial vowel: ingaphandle -> ngaphandle
+            entry_id = self._words.get(word[1:])
+        if entry_id is not None:
+            return entry_id
+        # suffix_splits yields the shortest stem first, so the last hit is the longest
+        noun_hit = -1
+        for i in self.noun_stems.suffix_splits(word):
+            stem = word[i:]
+            if len(stem) < STEM_FORM_MIN:
+                continue
+            for entry_id, group in self._noun_ids[stem]:
+                if word[:i] in group:
+                    noun_hit = entry_id
+                    break
+        if noun_hit >= 0:
+            return noun_hit
+        best = None
+        for base, i in self.matcher.verb_splits(word):
+            stem = base[i:]
+            if base != word and (i == 0 or len(stem) < STEM_FORM_MIN):
+                continue  # an undone ending needs a concord and a long stem (uthe is not -tha)
+            if len(stem) < STEM_FORM_MIN and not (i and self.matcher.is_prefix_chain(word[:i], 2)):
+                continue  # short stems need a short concord chain (akandibo-na-nga is not -nga)
+            # A lone noun prefix makes a noun, not a verb form (umthi is not -thi)
+            if self._stem_ids[stem] in self._verbs and word[:i] in NOUN_PREFIXES and word[:i] not in ('uku', 'ukw'):
+                continue
+            if best is None or len(stem) > len(best):
+                best = stem
+        return self._stem_ids[best] if best is not None else -1
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def load_dictionary(data_dir: Path = DATA_DIR) -> Dictionary:
+    with (data_dir / NOTES_FILE).open('r', encoding='utf-8') as f:
+        notes = json.load(f)
+    dictionary = Dictionary()
+    for entry in notes:
+        if entry.get('deck') != VOCAB_DECK:
+            continue
+        xh = clean_display(entry.get('xh'))
+        if len(list(tokenize(xh))) == 1:
+            dictionary.add(xh, clean_display(entry.get('en')))
+    return dictionary.index()
+
+
+# ---------------------- Statistics ----------------------
+def compute_stats(corpus: Corpus, dictionary: Dictionary) -> dict:
+    V, L = corpus.n_words, corpus.n_lessons
+    ids, lesson_ids = corpus.ids, corpus.lesson_ids
+
+    freq = np.bincount(ids, minlength=V)
+    tokens_per_lesson = np.bincount(lesson_ids, minlength=L)
+
+    # Distinct words per lesson: unique (lesson, word) pairs
+    pairs = np.unique(lesson_ids.astype(np.int64) * V + ids)
+    distinct_per_lesson = np.bincount(pairs // max(V, 1), minlength=L)
+
+    # Tokens are stored in lesson order, so a word's first index is where it is introduced
+    first_seen = np.full(V, -1, dtype=np.int32)
+    if ids.size:
+        uniq, first_idx = np.unique(ids, return_index=True)
+        first_seen[uniq] = lesson_ids[first_idx]
+    new_per_lesson = np.bincount(first_seen[first_seen >= 0], minlength=L)
+
+    # Map each distinct word (not each token) to a dictionary entry, then
+    # take the earliest lesson per entry over tokens and key_vocabulary
+    D = len(dictionary)
+    word_entry = np.asarray([dictionary.lookup(w) for w in corpus.words], dtype=np.int32).reshape(-1)
+    token_entry = word_entry[ids] if V else np.zeros(0, dtype=np.int32)
+    kv_lessons = np.asarray([l for l, _, _ in corpus.key_vocab], dtype=np.int32)
+    kv_entry = np.asarray(
+        [dictionary.lookup_exact(w) if exact else dictionary.lookup(w) for _, w, exact in corpus.key_vocab],
+        dtype=np.int32,
+    )
+    hit_lessons = np.concatenate([lesson_ids[token_entry >= 0], kv_lessons[kv_entry >= 0]])
+    hit_entries = np.concatenate([token_entry[token_entry >= 0], kv_entry[kv_entry >= 0]])
+
+    first_taught = np.full(D, L, dtype=np.int32)
+    np.minimum.at(first_taught, hit_entries, hit_lessons)
+    taught = first_taught < L
+    new_dict_per_lesson = np.bincount(first_taught[taught], minlength=L)
+    cumulative_dict = np.cumsum(new_dict_per_lesson)
+    dict_size = max(D, 1)
+
+    forms = {}
+    for word_id in np.flatnonzero(word_entry >= 0):
+        forms.setdefault(int(word_entry[word_id]), []).append(corpus.words[word_id])
+    from_key_vocab = np.zeros(D, dtype=bool)
+    from_key_vocab[kv_entry[kv_entry >= 0]] = True
+
+    bands = np.asarray(FREQ_BANDS + (np.iinfo(np.int64).max,))
+    band_counts = np.bincount(np.searchsorted(bands, freq, side='right') - 1, minlength=len(FREQ_BANDS))
+
+    return {
+        'freq': freq,
+        'tokens_per_lesson': tokens_per_lesson,
+        'distinct_per_lesson': distinct_per_lesson,
+        'new_per_lesson': new_per_lesson,
+        'cumulative_new': np.cumsum(new_per_lesson),
+        'new_dict_per_lesson': new_dict_per_lesson,
+        'cumulative_dict': cumulative_dict,
+        'coverage': cumulative_dict / dict_size,
+        'dict_size': D,
+        'first_taught': first_taught,
+        'taught': taught,
+        'forms': forms,
+        'from_key_vocab': from_key_vocab,
+        'band_counts': band_counts[:len(FREQ_BANDS)],
+    }
+
+
+# ---------------------- Report ----------------------
+def _cell(text: str) -> str:
+    return str(text).replace('|', '/')
+
+
+def render_report(corpus: Corpus, dictionary: Dictionary, stats: dict, top: int = 30, untaught: bool = False) -> str:
+    freq = stats['freq']
+    total = int(freq.sum())
+    taught = stats['taught']
+    lines = [
+        '# isiXhosa Course: Corpus Statistics',
+        '',
+        f'- Lessons: {corpus.n_lessons}',
+        f'- isiXhosa tokens: {total}',
+        f'- Distinct words: {corpus.n_words}',
+        f"- Dictionary vocabulary taught: {int(taught.sum())} of {stats['dict_size']}"
+        f" ({int(taught.sum()) / max(stats['dict_size'], 1):.1%})",
+        '',
+        'A lesson word counts towards a dictionary headword when it is that headword, the',
+        'same noun stem with a prefix of the same noun class (abafazi -> umfazi), or known',
+        'concords plus a verb stem with its ending undone (ndifundile -> -funda). A',
+        "lesson's key_vocabulary also counts as taught in that lesson; affix entries only",
+        'when they match a headword exactly. The matching is heuristic, so treat single',
+        'odd matches with care.',
+        '',
+        '## Vocabulary load per lesson',
+        '',
+        '| Lesson | Title | Tokens | Distinct | New words | New dictionary words | Cumulative words | Dictionary coverage |',
+        '|---:|---|---:|---:|---:|---:|---:|---:|',
+    ]
+    for i, title in enumerate(corpus.lesson_titles):
+        lines.append(
+            f"| {i + 1} | {title.replace('|', '/')} | {stats['tokens_per_lesson'][i]} | {stats['distinct_per_lesson'][i]}"
+            f" | {stats['new_per_lesson'][i]} | {stats['new_dict_per_lesson'][i]} | {stats['cumulative_new'][i]}"
+            f" | {stats['coverage'][i]:.1%} |"
+        )
+
+    lines += ['', '## Frequency distribution', '', '| Occurrences | Words |', '|---|---:|']
+    bounds = list(FREQ_BANDS)
+    for i, lo in enumerate(bounds):
+        hi = bounds[i + 1] - 1 if i + 1 < len(bounds) else None
+        label = f'{lo}' if hi == lo else (f'{lo}–{hi}' if hi else f'{lo}+')
+        lines.append(f"| {label} | {stats['band_counts'][i]} |")
+
+    lines += [
+        '',
+        '## Dictionary words taught',
+        '',
+        '| First lesson | Word | Meaning | Forms in lessons | Key vocabulary |',
+        '|---:|---|---|---|:---:|',
+    ]
+    first_taught = stats['first_taught']
+    for entry_id in sorted(np.flatnonzero(taught), key=lambda e: (first_taught[e], dictionary.entries[e]['word'].casefold())):
+        entry = dictionary.entries[entry_id]
+        forms = ', '.join(sorted(stats['forms'].get(int(entry_id), [])))
+        key_vocab = 'yes' if stats['from_key_vocab'][entry_id] else ''
+        lines.append(
+            f"| {first_taught[entry_id] + 1} | {_cell(entry['word'])} | {_cell(entry['meaning'])}"
+            f" | {_cell(forms)} | {key_vocab} |"
+        )
+
+    if untaught:
+        lines += ['', '## Dictionary words not yet taught', '', '| Word | Meaning |', '|---|---|']
+        rest = sorted(np.flatnonzero(~taught), key=lambda e: dictionary.entries[e]['word'].casefold())
+        for entry_id in rest:
+            entry = dictionary.entries[entry_id]
+            lines.append(f"| {_cell(entry['word'])} | {_cell(entry['meaning'])} |")
+
+    order = np.argsort(-freq, kind='stable')[:top]
+    lines += ['', f'## Top {len(order)} words', '', '| Rank | Word | Count | Share |', '|---:|---|---:|---:|']
+    for rank, word_id in enumerate(order, start=1):
+        count = int(freq[word_id])
+        lines.append(f'| {rank} | {_cell(corpus.words[word_id])} | {count} | {count / max(total, 1):.2%} |')
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write corpus statistics and dictionary coverage for the course.')
+    parser.add_argument('--out', type=Path, default=OUT_PATH, help=f'report path (default: {OUT_PATH})')
+    parser.add_argument('--top', type=int, default=30, help='number of most frequent words to list')
+    parser.add_argument('--untaught', action='store_true', help='also list dictionary words the course does not teach')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    checker = build_checker()
+    corpus = load_corpus(english=checker.english)
+    dictionary = load_dictionary()
+    stats = compute_stats(corpus, dictionary)
+    report = render_report(corpus, dictionary, stats, top=args.top, untaught=args.untaught)
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(report, encoding='utf-8')
+    print(f'{corpus.n_lessons} lessons, {corpus.ids.size} tokens, {corpus.n_words} distinct words')
+    print(f'Wrote {args.out} in {time.perf_counter() - started:.2f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,10 @@ from datetime import datetime
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from sanitize_data import clean_display, sanitize_all
+from build_derived import build as build_derived
+from orthography import build_checker
+
 DATA_FILES_ORDER = [
     'part1.json',          # 1–10
     'part2.json',         # 11–25
@@ -16,6 +20,9 @@ DATA_FILES_ORDER = [
     'part6.json',         # 41–45
 ]
 
+# Delay before re-checking an edited line, so typing is never blocked
+CHECK_DELAY_MS = 300
+
 class LessonEditorApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -41,9 +48,17 @@ class LessonEditorApp(tk.Tk):
         self.current_lesson_num = None
         self.unsaved_changes = False
         self.turn_widgets = []  # list of { 'teacher': Text, 'student': Text, 'turn_ref': dict }
+        self.check_scopes = {}   # Text -> 'bold' | 'all'
+        self.check_pending = {}  # Text -> set of line numbers, or None for the whole widget
+        self.check_jobs = {}     # Text -> after() id
 
         # Load data
         self._load_all_files()
+        try:
+            self.checker = build_checker()
+        except Exception as e:
+            self.checker = None
+            messagebox.showwarning('Orthography check', f'Could not build the lexicon; checking is off.\n\n{e}')
 
         # Build UI
         self._build_topbar()
@@ -90,8 +105,8 @@ class LessonEditorApp(tk.Tk):
 
     @staticmethod
     def _strip_md(text: str) -> str:
-        # Minimal markdown cleanup for titles
-        return text.replace('**', '').strip()
+        # Same title cleanup as the sanitize/TOC pipeline
+        return clean_display(text, title=True)
 
     def _get_lesson_by_number(self, lesson_num: int):
         fi, li = self.index_map[lesson_num]
@@ -196,6 +211,11 @@ class LessonEditorApp(tk.Tk):
 
     def _render_lesson_editor(self):
         # Clear previous widgets
+        for job in self.check_jobs.values():
+            self.after_cancel(job)
+        self.check_jobs.clear()
+        self.check_pending.clear()
+        self.check_scopes.clear()
         for child in self.inner.winfo_children():
             child.destroy()
         self.turn_widgets.clear()
@@ -262,13 +282,67 @@ class LessonEditorApp(tk.Tk):
                 self.unsaved_changes = True
             if t_text is not None:
                 t_text.bind('<KeyRelease>', mark_dirty)
+                # Teacher dialogue is mostly English; its isiXhosa is in **bold**
+                self._attach_checker(t_text, 'bold')
             if s_text is not None:
                 s_text.bind('<KeyRelease>', mark_dirty)
+                self._attach_checker(s_text, 'all')
 
             self.turn_widgets.append({'teacher': t_text, 'student': s_text, 'section_var': sec_var, 'turn_ref': turn})
 
         ttk.Label(self.inner, text='').pack(pady=10)
 
+    # ---------------------- Orthography check ----------------------
+    def _attach_checker(self, widget, scope: str):
+        if self.checker is None:
+            return
+        widget.tag_configure('unknown', underline=True, foreground='#b00020')
+        self.check_scopes[widget] = scope
+        widget.bind('<KeyRelease>', self._on_text_edit, add='+')
+        widget.bind('<<Paste>>', lambda e, w=widget: self._schedule_check(w, None), add='+')
+        widget.bind('<<Cut>>', lambda e, w=widget: self._schedule_check(w, None), add='+')
+        self._schedule_check(widget, None)
+
+    def _on_text_edit(self, event):
+        widget = event.widget
+        # Ignore navigation and modifier keys
+        if not event.char and event.keysym not in ('BackSpace', 'Delete', 'Return', 'KP_Enter'):
+            return
+        line = int(widget.index('insert').split('.')[0])
+        if event.keysym in ('Return', 'KP_Enter', 'BackSpace', 'Delete'):
+            # Line splits/joins also change the neighbouring line
+            lines = {max(1, line - 1), line}
+        else:
+            lines = {line}
+        self._schedule_check(widget, lines)
+
+    def _schedule_check(self, widget, lines):
+        if widget not in self.check_pending:
+            self.check_pending[widget] = lines
+        elif self.check_pending[widget] is not None:
+            self.check_pending[widget] = None if lines is None else self.check_pending[widget] | lines
+        job = self.check_jobs.pop(widget, None)
+        if job is not None:
+            self.after_cancel(job)
+        self.check_jobs[widget] = self.after(CHECK_DELAY_MS, lambda: self._run_check(widget))
+
+    def _run_check(self, widget):
+        self.check_jobs.pop(widget, None)
+        lines = self.check_pending.pop(widget, set())
+        scope = self.check_scopes.get(widget)
+        if scope is None or not widget.winfo_exists():
+            return
+        last = int(widget.index('end-1c').split('.')[0])
+        if lines is None:
+            lines = range(1, last + 1)
+        for n in lines:
+            if n > last:
+                continue
+            widget.tag_remove('unknown', f'{n}.0', f'{n}.end')
+            text = widget.get(f'{n}.0', f'{n}.end')
+            for start, end, token in self.checker.check_line(text, scope):
+                widget.tag_add('unknown', f'{n}.{start}', f'{n}.{end}')
+
     def _renumber_turns(self, turns):
         for i, t in enumerate(turns, start=1):
             t['turn_number'] = i
@@ -413,9 +487,19 @@ class LessonEditorApp(tk.Tk):
             with src.open('w', encoding='utf-8') as f:
                 json.dump(record['data'], f, ensure_ascii=False, indent=2)
             self.unsaved_changes = False
-            messagebox.showinfo('Saved', f"Saved to {src.name}\nBackup: backups/{backup_path.name}")
         except Exception as e:
             messagebox.showerror('Save failed', f'Could not write file: {e}')
+            return
+        self._refresh_site_data()
+        messagebox.showinfo('Saved', f"Saved to {src.name}\nBackup: backups/{backup_path.name}")
+
+    def _refresh_site_data(self):
+        # Keep the dev server's sanitized/derived copies in step with the saved parts
+        try:
+            sanitize_all()
+            build_derived()
+        except Exception as e:
+            messagebox.showwarning('Site data', f'Saved, but could not rebuild the site data:\n{e}')
 
     def _on_quit(self):
         if self.unsaved_changes:
@@ -0,0 +1,368 @@
+# Socratic Xhosa - Orthography Checker
+# Run: python tools/orthography.py
+#
+# Builds a lexicon trie from the dictionary (Vocabulary and Sentences decks),
+# the texts and every lesson's key_vocabulary, then reports Xhosa words in
+# lesson dialogue and practice answers that the lexicon does not recognise.
+# The lesson editor uses the same checker to underline unknown words as you
+# type.
+#
+# isiXhosa is agglutinative, so a word is also accepted when it splits into up
+# to MAX_MORPHEMES known prefixes/concords followed by either a known word
+# (ngu-mfundi) or a stem from the dictionary's "-stem" headwords, with verb
+# endings and one extension undone first (ndi-ya-si-fun-ile, a-ku-fun-i,
+# si-ya-bon-an-a). This is a heuristic: "unknown" means "worth a look", not
+# "wrong".
+
+import argparse
+import json
+import re
+from pathlib import Path
+
+from sanitize_data import LESSON_FILES, clean_display
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT_DIR / 'public' / 'data'
+LESSON_DIR = DATA_DIR / 'lesson_data'
+
+NOTE_DECKS = ('Xhosa::Vocabulary', 'Xhosa::Sentences')
+TEXTS_FILE = 'Xhosa_texts.json'
+NOTES_FILE = 'Xhosa_notes.json'
+
+# Noun class prefixes, concords, tense/aspect markers and common particles.
+# Bare consonants are deliberately absent: as free links in a chain they let
+# concord typos such as kkufuna or mbafazi through.
+MORPHEMES = (
+    'a', 'e', 'i', 'o', 'u',
+    'um', 'umu', 'aba', 'abe', 'imi', 'ili', 'ama', 'isi', 'izi', 'in', 'im',
+    'izin', 'izim', 'ulu', 'ubu', 'uku', 'ukw', 'aka', 'ii',
+    'ndi', 'ndu', 'si', 'ni', 'ba', 'li', 'lu', 'bu', 'ku', 'kw', 'zi', 'wa', 'wu',
+    'yi', 'ya', 'be', 'ye', 'za', 'sa', 'nga', 'ka', 'se', 'le', 'la', 'lo',
+    'na', 'ne', 'no', 'nge', 'ngo', 'kwa', 'kwi', 'kum', 'ngu', 'yin',
+    'ze', 'zo', 'bo', 'ho', 'so', 'ma', 'me', 'mu',
+    'nda', 'ndo', 'ang', 'ange', 'ing', 'inge', 'zuku',
+)
+# Class 1 object concord, only valid directly before a verb stem (ndiya-m-bona)
+OBJECT_CONCORDS = ('m',)
+# Glides that stand in for a concord before a vowel-initial stem (siya-y-oyisa)
+GLIDES = ('y', 'w')
+VOWELS = 'aeiou'
+# Inflected endings that replace a verb's final -a, longest first, and the
+# extensions that may sit before them (passive, causative, applied,
+# reciprocal, neuter)
+VERB_ENDINGS = ('ileyo', 'ayo', 'anga', 'ile', 'a', 'e', 'i')
+VERB_EXTENSIONS = ('isis', 'is', 'el', 'an', 'ek', 'w')
+MAX_MORPHEMES = 4
+MIN_STEM = 3
+MIN_WORD = 2
+
+_TOKEN_RE = re.compile(r"-?[^\W\d_]+(?:['’][^\W\d_]+)*-?")
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_END = ''
+
+
+def normalize_word(token: str) -> str:
+    return token.strip('-').replace('’', "'").casefold()
+
+
+def verb_bases(key: str):
+    """Yield key's -a forms with a verb ending, and at most one extension, undone.
+
+    E.g. fundile -> funda, bonwa -> bona, sebenzisisa -> sebenza.
+    """
+    seen = set()
+    for ending in VERB_ENDINGS:
+        if not key.endswith(ending) or len(key) - len(ending) < 2:
+            continue
+        root = key[:len(key) - len(ending)]
+        roots = [root] + [root[:-len(ext)] for ext in VERB_EXTENSIONS if root.endswith(ext) and len(root) - len(ext) >= 2]
+        for r in roots:
+            base = r + 'a'
+            if base != key and base not in seen:
+                seen.add(base)
+                yield base
+
+
+def tokenize(text: str):
+    """Yield (start, end, token) for each word in text."""
+    for m in _TOKEN_RE.finditer(text):
+        yield m.start(), m.end(), m.group()
+
+
+def xhosa_segments(line: str, scope: str = 'all'):
+    """Return [(offset, segment)] of the parts of line that hold isiXhosa."""
+    if scope == 'bold':
+        return [(m.start(1), m.group(1)) for m in _BOLD_RE.finditer(line)]
+    return [(0, line)]
+
+
+class LexiconTrie:
+    """Character trie of known words, with a reversed copy for suffix lookups."""
+
+    def __init__(self):
+        self.root = {}
+        self.reversed_root = {}
+        self.size = 0
+
+    @staticmethod
+    def _insert(root: dict, word: str) -> bool:
+        node = root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        if _END in node:
+            return False
+        node[_END] = True
+        return True
+
+    def add(self, word: str):
+        if len(word) < MIN_WORD:
+            return
+        if self._insert(self.root, word):
+            self._insert(self.reversed_root, word[::-1])
+            self.size += 1
+
+    def __contains__(self, word: str) -> bool:
+        node = self.root
+        for ch in word:
+            node = node.get(ch)
+            if node is None:
+                return False
+        return _END in node
+
+    def __len__(self):
+        return self.size
+
+    def suffix_splits(self, word: str):
+        """Yield i such that word[i:] is a known word of at least MIN_STEM letters."""
+        node = self.reversed_root
+        for depth, ch in enumerate(reversed(word), start=1):
+            node = node.get(ch)
+            if node is None:
+                return
+            if _END in node and depth >= MIN_STEM and depth < len(word):
+                yield len(word) - depth
+
+
+class OrthographyChecker:
+    def __init__(self, lexicon: LexiconTrie, english=None, morphemes=MORPHEMES, stems: LexiconTrie = None,
+                 coalesce: str = VOWELS):
+        self.lexicon = lexicon
+        # Initial vowels a stem may share with the prefix before it (ba-s-endlwini)
+        self.coalesce = coalesce
+        self.english = english or set()
+        self.stems = stems if stems is not None else LexiconTrie()
+        self.morphemes = LexiconTrie()
+        for m in morphemes:
+            self.morphemes._insert(self.morphemes.root, m)
+        self._cache = {}
+
+    # ---------------------- Lookup ----------------------
+    def is_prefix_chain(self, prefix: str, budget: int = MAX_MORPHEMES) -> bool:
+        """True if prefix splits into at most `budget` known morphemes."""
+        if not prefix:
+            return True
+        if budget == 0:
+            return False
+        node = self.morphemes.root
+        for i, ch in enumerate(prefix):
+            node = node.get(ch)
+            if node is None:
+                return False
+            if _END in node and self.is_prefix_chain(prefix[i + 1:], budget - 1):
+                return True
+        return False
+
+    def stem_splits(self, key: str, trie: LexiconTrie = None):
+        """Yield i where key[:i] is a prefix chain and key[i:] is a word in trie.
+
+        Splits come shortest stem first; trie defaults to the lexicon.
+        """
+        trie = trie if trie is not None else self.lexicon
+        for i in trie.suffix_splits(key):
+            if self.is_prefix_chain(key[:i]):
+                yield i
+
+    def can_precede(self, prefix: str, stem: str, verb: bool = False) -> bool:
+        """True if prefix is a prefix chain that may sit directly before stem.
+
+        Besides a plain chain this allows a vowel shared with a vowel-initial
+        stem (ba-s-endlwini = ba-se + endlwini), a glide before such a stem and,
+        for consonant-initial verb stems, a final object concord.
+        """
+        if self.is_prefix_chain(prefix):
+            return True
+        starts_with_vowel = stem[:1] in VOWELS
+        if stem[:1] in self.coalesce and self.is_prefix_chain(prefix + stem[0]):
+            return True
+        last = prefix[-1:]
+        if (last in GLIDES and starts_with_vowel) or (verb and last in OBJECT_CONCORDS and not starts_with_vowel):
+            return self.is_prefix_chain(prefix[:-1], MAX_MORPHEMES - 1)
+        return False
+
+    def verb_splits(self, key: str):
+        """Yield (base, i) where base is key or one of its verb_bases, base[i:] is
+        a known stem and base[:i] can precede it.
+        """
+        for base in (key, *verb_bases(key)):
+            if base in self.stems:
+                yield base, 0
+            for i in self.stems.suffix_splits(base):
+                if self.can_precede(base[:i], base[i:], verb=True):
+                    yield base, i
+
+    def word_splits(self, key: str):
+        """Yield i where key[i:] is a known word and key[:i] can precede it.
+
+        A bare vowel is a subject concord, so it needs a verb stem rather than
+        a whole word: i-bafazi is a typo for abafazi, not a split.
+        """
+        for i in self.lexicon.suffix_splits(key):
+            prefix = key[:i]
+            if prefix.strip(VOWELS) and self.can_precede(prefix, key[i:]):
+                yield i
+
+    def is_known(self, word: str) -> bool:
+        key = normalize_word(word)
+        cached = self._cache.get(word)
+        if cached is not None:
+            return cached
+        # Fragments such as 'um-' or '-ku-' are prefixes/concords, not words
+        fragment = word.endswith('-')
+        known = (
+            len(key) < MIN_WORD
+            or (fragment and self.is_prefix_chain(key))
+            or key in self.lexicon
+            or key in self.english
+            or any(True for _ in self.word_splits(key))
+            or any(True for _ in self.verb_splits(key))
+        )
+        self._cache[word] = known
+        return known
+
+    # ---------------------- Checking ----------------------
+    def check_line(self, line: str, scope: str = 'all'):
+        """Return [(start, end, token)] of unknown words in a single line.
+
+        scope='bold' only checks **bold** spans, which is where lesson
+        dialogue puts its isiXhosa; scope='all' checks every word.
+        """
+        unknown = []
+        for offset, segment in xhosa_segments(line, scope):
+            for start, end, token in tokenize(segment):
+                if not self.is_known(token):
+                    unknown.append((offset + start, offset + end, token))
+        return unknown
+
+    def check_text(self, text: str, scope: str = 'all'):
+        """Return [(line_no, start, end, token)] with 1-based line numbers."""
+        results = []
+        for line_no, line in enumerate(text.split('\n'), start=1):
+            for start, end, token in self.check_line(line, scope):
+                results.append((line_no, start, end, token))
+        return results
+
+
+# ---------------------- Lexicon loading ----------------------
+def _load_json(path: Path):
+    with path.open('r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _add_text(lexicon: LexiconTrie, text):
+    for _, _, token in tokenize(clean_display(text)):
+        lexicon.add(normalize_word(token))
+
+
+def _add_stems(stems: LexiconTrie, text):
+    # '-funa' style headwords are stems; 'ukufuna' infinitives carry one too
+    for _, _, token in tokenize(clean_display(text)):
+        key = normalize_word(token)
+        if token.startswith('-') and not token.endswith('-'):
+            stems.add(key)
+        elif key.startswith(('uku', 'ukw')) and len(key) > 5:
+            stems.add(key[3:])
+
+
+def build_checker(data_dir: Path = DATA_DIR) -> OrthographyChecker:
+    lexicon = LexiconTrie()
+    stems = LexiconTrie()
+    english = set()
+
+    def add_english(text):
+        for _, _, token in tokenize(clean_display(text)):
+            english.add(normalize_word(token))
+
+    notes_path = data_dir / NOTES_FILE
+    if notes_path.exists():
+        for entry in _load_json(notes_path):
+            if entry.get('deck') in NOTE_DECKS:
+                _add_text(lexicon, entry.get('xh'))
+                _add_stems(stems, entry.get('xh'))
+                add_english(entry.get('en'))
+
+    texts_path = data_dir / TEXTS_FILE
+    if texts_path.exists():
+        for entry in _load_json(texts_path):
+            _add_text(lexicon, entry.get('xh'))
+            add_english(entry.get('en'))
+
+    for fname in LESSON_FILES:
+        path = data_dir / 'lesson_data' / fname
+        if not path.exists():
+            continue
+        for lesson in _load_json(path).get('lessons', []):
+            for item in lesson.get('key_vocabulary') or []:
+                if isinstance(item, dict):
+                    _add_text(lexicon, item.get('word'))
+                    _add_stems(stems, item.get('word'))
+                    add_english(item.get('meaning'))
+
+    # A token that is both isiXhosa and English stays checkable as isiXhosa
+    return OrthographyChecker(lexicon, {w for w in english if w not in lexicon}, stems=stems)
+
+
+# ---------------------- Headless run ----------------------
+def check_all_parts(checker: OrthographyChecker, lesson_dir: Path = LESSON_DIR):
+    """Yield (lesson_num, location, token) for every unknown word in all parts."""
+    global_num = 1
+    for fname in LESSON_FILES:
+        path = lesson_dir / fname
+        if not path.exists():
+            print(f'Missing file: {path}')
+            continue
+        for lesson in _load_json(path).get('lessons', []):
+            for idx, turn in enumerate(lesson.get('turns') or [], start=1):
+                turn_num = turn.get('turn_number', idx)
+                for key, speaker, scope in (('teacher_dialogue', 'teacher', 'bold'), ('student_dialogue', 'student', 'all')):
+                    text = turn.get(key)
+                    if not text:
+                        continue
+                    for line_no, start, end, token in checker.check_text(str(text), scope):
+                        yield global_num, f'turn {turn_num} {speaker}', token
+            for idx, item in enumerate(lesson.get('practice') or [], start=1):
+                if isinstance(item, dict) and item.get('answer'):
+                    for line_no, start, end, token in checker.check_text(str(item['answer'])):
+                        yield global_num, f'practice {idx} answer', token
+            global_num += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report isiXhosa words the lexicon does not recognise.')
+    parser.add_argument('--summary', action='store_true', help='only print counts per unknown word')
+    args = parser.parse_args()
+
+    checker = build_checker()
+    print(f'Lexicon: {len(checker.lexicon)} words')
+    counts = {}
+    for lesson_num, location, token in check_all_parts(checker):
+        counts[normalize_word(token)] = counts.get(normalize_word(token), 0) + 1
+        if not args.summary:
+            print(f'Lesson {lesson_num}, {location}: {token}')
+    if args.summary:
+        for word, n in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0])):
+            print(f'{n:4d}  {word}')
+    print(f'{sum(counts.values())} unknown tokens, {len(counts)} distinct')
+
+
+if __name__ == '__main__':
+    main()
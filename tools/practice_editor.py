@@ -1,22 +1,29 @@
 # Socratic Xhosa - Practice Array Editor (Tkinter)
 # Run: python tools/practice_editor.py
 
+import csv
+import io
 import json
 from pathlib import Path
 from datetime import datetime
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+
+from sanitize_data import clean_display, sanitize_all
+from build_derived import build as build_derived
 
 DATA_FILES_ORDER = [
-    'foundation_lessons.json',          # 1–10
-    'part2_lessons_11_25.json',         # 11–25
-    'part3_lessons_26_30.json',         # 26–30
-    'part3_lessons_31_35.json',         # 31–35
-    'part4_lessons_36_40.json',         # 36–40
-    'part4_lessons_41_45.json',         # 41–45
-    'part4_lessons_46_50.json',         # 46–50
+    'part1.json',
+    'part2.json',
+    'part3.json',
+    'part4.json',
+    'part5.json',
+    'part6.json',
 ]
 
+GRID_COLUMNS = ('lesson', 'n', 'prompt', 'answer')
+GRID_EDITABLE = ('prompt', 'answer')
+
 class PracticeEditorApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -26,7 +33,7 @@ class PracticeEditorApp(tk.Tk):
         # Paths
         self.root_dir: Path = Path(__file__).resolve().parent
         # Now that the script lives in tools/, JSON lives one level up in public/data
-        self.data_dir: Path = self.root_dir.parent / 'public' / 'data'
+        self.data_dir: Path = self.root_dir.parent / 'public' / 'data' / 'lesson_data'
         self.backup_dir: Path = self.data_dir / 'backups'
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
@@ -37,8 +44,11 @@ class PracticeEditorApp(tk.Tk):
 
         # State
         self.current_lesson_num = None
-        self.unsaved_changes = False
         self.item_widgets = []  # list of {'prompt': Text, 'answer': Text}
+        self.grid_mode = False
+        self.dirty_files = set()  # file_idx values with unsaved edits; the source of truth for 'unsaved'
+        self.row_map = {}         # treeview iid -> (lesson_num, item_idx)
+        self.cell_editor = None   # {'entry': Entry, 'iid': str, 'column': str}
 
         # Load JSON
         self._load_all_files()
@@ -46,6 +56,7 @@ class PracticeEditorApp(tk.Tk):
         # UI
         self._build_topbar()
         self._build_scrollable_editor()
+        self._build_grid_editor()
 
         # Default selection
         if self.lesson_options:
@@ -88,7 +99,8 @@ class PracticeEditorApp(tk.Tk):
 
     @staticmethod
     def _strip_md(text: str) -> str:
-        return text.replace('**', '').strip()
+        # Same title cleanup as the sanitize/TOC pipeline
+        return clean_display(text, title=True)
 
     def _get_lesson_by_number(self, lesson_num: int):
         fi, li = self.index_map[lesson_num]
@@ -117,6 +129,11 @@ class PracticeEditorApp(tk.Tk):
         ttk.Button(top, text='Reload lesson', command=self._reload_current_from_disk).pack(side='left', padx=6)
         ttk.Button(top, text='Add practice item', command=self._add_item).pack(side='left', padx=6)
 
+        self.mode_var = tk.StringVar(value='Grid view')
+        ttk.Button(top, textvariable=self.mode_var, command=self._toggle_mode).pack(side='left', padx=6)
+        ttk.Button(top, text='Import TSV/CSV', command=self._import_file).pack(side='left')
+        ttk.Button(top, text='Export TSV/CSV', command=self._export_file).pack(side='left', padx=6)
+
         # Info label
         self.info_var = tk.StringVar(value=str(self.data_dir))
         info = ttk.Label(top, textvariable=self.info_var, foreground='#666')
@@ -125,6 +142,7 @@ class PracticeEditorApp(tk.Tk):
     def _build_scrollable_editor(self):
         container = ttk.Frame(self)
         container.pack(fill='both', expand=True)
+        self.list_container = container
 
         self.canvas = tk.Canvas(container, borderwidth=0, highlightthickness=0)
         vscroll = ttk.Scrollbar(container, orient='vertical', command=self.canvas.yview)
@@ -144,6 +162,32 @@ class PracticeEditorApp(tk.Tk):
         self.canvas.bind_all('<Button-4>', self._on_mousewheel_linux)
         self.canvas.bind_all('<Button-5>', self._on_mousewheel_linux)
 
+    def _build_grid_editor(self):
+        # One Treeview for every lesson's practice items; rows are cheap, so
+        # cost does not grow with per-item widgets the way the list view does
+        self.grid_container = ttk.Frame(self)
+
+        self.tree = ttk.Treeview(self.grid_container, columns=GRID_COLUMNS, show='headings', selectmode='extended')
+        self.tree.heading('lesson', text='Lesson')
+        self.tree.heading('n', text='#')
+        self.tree.heading('prompt', text='Prompt')
+        self.tree.heading('answer', text='Answer')
+        self.tree.column('lesson', width=60, stretch=False, anchor='center')
+        self.tree.column('n', width=40, stretch=False, anchor='center')
+        self.tree.column('prompt', width=520)
+        self.tree.column('answer', width=360)
+
+        vscroll = ttk.Scrollbar(self.grid_container, orient='vertical', command=self.tree.yview)
+        self.tree.configure(yscrollcommand=lambda *a: (self._commit_cell_edit(), vscroll.set(*a)))
+        vscroll.pack(side='right', fill='y')
+        self.tree.pack(side='left', fill='both', expand=True)
+
+        self.tree.bind('<<TreeviewSelect>>', self._on_tree_select)
+        self.tree.bind('<Double-1>', self._begin_cell_edit)
+        self.tree.bind('<Return>', self._begin_cell_edit)
+        self.tree.bind('<Delete>', lambda e: self._delete_grid_rows())
+        self.tree.bind('<Control-v>', lambda e: self._paste_rows())
+
     def _on_canvas_configure(self, event):
         self.canvas.itemconfig(self.canvas_window, width=event.width)
 
@@ -168,10 +212,14 @@ class PracticeEditorApp(tk.Tk):
                 break
 
     def _on_select_lesson(self, event=None):
-        if self.unsaved_changes:
+        # Grid view spans every lesson, so switching lessons there keeps edits
+        if not self.grid_mode and self._has_unsaved():
             if not messagebox.askyesno('Unsaved changes', 'Discard unsaved changes?'):
                 self._set_combo_to_current()
                 return
+            if not self._discard_changes():
+                self._set_combo_to_current()
+                return
 
         sel = self.lesson_var.get()
         if not sel:
@@ -181,7 +229,9 @@ class PracticeEditorApp(tk.Tk):
         except ValueError:
             return
         self.current_lesson_num = lesson_num
-        self.unsaved_changes = False
+        if self.grid_mode:
+            self._grid_show_lesson(lesson_num)
+            return
         self._render_practice_editor()
 
     # ---------------------- Rendering ----------------------
@@ -222,26 +272,322 @@ class PracticeEditorApp(tk.Tk):
             a_text.pack(fill='x', padx=4, pady=(0, 2))
             a_text.insert('1.0', str(item.get('answer', '') or ''))
 
-            def mark_dirty(event, self=self):
-                self.unsaved_changes = True
-            p_text.bind('<KeyRelease>', mark_dirty)
-            a_text.bind('<KeyRelease>', mark_dirty)
-
             self.item_widgets.append({'prompt': p_text, 'answer': a_text})
 
         ttk.Label(self.inner, text='').pack(pady=10)
 
+    # ---------------------- Grid view ----------------------
+    def _toggle_mode(self):
+        self._commit_cell_edit()
+        if self.grid_mode:
+            self.grid_container.pack_forget()
+            self.list_container.pack(fill='both', expand=True)
+            self.grid_mode = False
+            self.mode_var.set('Grid view')
+            if self.current_lesson_num is not None:
+                self._render_practice_editor()
+            return
+
+        # Keep edits made in the list view before switching
+        self._sync_item_widgets()
+        self.list_container.pack_forget()
+        self.grid_container.pack(fill='both', expand=True)
+        self.grid_mode = True
+        self.mode_var.set('List view')
+        self._populate_grid()
+        if self.current_lesson_num is not None:
+            self._grid_show_lesson(self.current_lesson_num)
+        self.tree.focus_set()
+
+    def _populate_grid(self):
+        self._commit_cell_edit()
+        self.tree.delete(*self.tree.get_children())
+        self.row_map.clear()
+        for lesson_num in sorted(self.index_map):
+            record, lesson, fi, li = self._get_lesson_by_number(lesson_num)
+            items = lesson.get('practice')
+            if not isinstance(items, list):
+                continue
+            for idx, item in enumerate(items):
+                iid = self.tree.insert('', 'end', values=(
+                    lesson_num,
+                    idx + 1,
+                    str(item.get('prompt', '') or ''),
+                    str(item.get('answer', '') or ''),
+                ))
+                self.row_map[iid] = (lesson_num, idx)
+
+    def _grid_rows_for_lesson(self, lesson_num: int):
+        return [iid for iid, (num, _) in self.row_map.items() if num == lesson_num]
+
+    def _grid_show_lesson(self, lesson_num: int):
+        rows = self._grid_rows_for_lesson(lesson_num)
+        if not rows:
+            # Nothing to show; drop the old focus so it can't redirect adds/pastes
+            self.tree.selection_set(())
+            self.tree.focus('')
+            return
+        self.tree.selection_set(rows)
+        self.tree.focus(rows[0])
+        self.tree.see(rows[-1])
+        self.tree.see(rows[0])
+
+    def _on_tree_select(self, event=None):
+        # Clicking a row makes its lesson the current one, so adds and
+        # 2-column pastes/imports always target the lesson shown in the combo
+        focus = self.tree.focus()
+        if focus not in self.row_map:
+            return
+        lesson_num = self.row_map[focus][0]
+        if lesson_num != self.current_lesson_num:
+            self.current_lesson_num = lesson_num
+            self._set_combo_to_current()
+
+    def _mark_lesson_dirty(self, lesson_num: int):
+        fi, li = self.index_map[lesson_num]
+        self.dirty_files.add(fi)
+
+    def _begin_cell_edit(self, event):
+        self._commit_cell_edit()
+        if event.type == tk.EventType.KeyPress:
+            iid = self.tree.focus()
+            column = '#3'
+        else:
+            if self.tree.identify_region(event.x, event.y) != 'cell':
+                return
+            iid = self.tree.identify_row(event.y)
+            column = self.tree.identify_column(event.x)
+        if iid not in self.row_map:
+            return
+        col_name = GRID_COLUMNS[int(column[1:]) - 1]
+        if col_name not in GRID_EDITABLE:
+            col_name = 'prompt'
+        bbox = self.tree.bbox(iid, col_name)
+        if not bbox:
+            return
+        x, y, w, h = bbox
+
+        entry = ttk.Entry(self.tree)
+        entry.insert(0, self.tree.set(iid, col_name))
+        entry.select_range(0, 'end')
+        entry.place(x=x, y=y, width=w, height=h)
+        entry.focus_set()
+        entry.bind('<Return>', lambda e: self._commit_cell_edit(refocus=True))
+        entry.bind('<KP_Enter>', lambda e: self._commit_cell_edit(refocus=True))
+        entry.bind('<Escape>', lambda e: self._cancel_cell_edit())
+        entry.bind('<Tab>', lambda e: self._next_cell_edit())
+        entry.bind('<FocusOut>', lambda e: self._commit_cell_edit())
+        self.cell_editor = {'entry': entry, 'iid': iid, 'column': col_name}
+
+    def _commit_cell_edit(self, refocus: bool = False):
+        editor = self.cell_editor
+        if editor is None:
+            return
+        self.cell_editor = None
+        value = editor['entry'].get().strip()
+        editor['entry'].destroy()
+
+        iid, col_name = editor['iid'], editor['column']
+        lesson_num, idx = self.row_map[iid]
+        record, lesson, fi, li = self._get_lesson_by_number(lesson_num)
+        item = lesson['practice'][idx]
+        if str(item.get(col_name, '') or '') != value:
+            item[col_name] = value
+            self.tree.set(iid, col_name, value)
+            self._mark_lesson_dirty(lesson_num)
+        if refocus:
+            self.tree.focus_set()
+        return 'break'
+
+    def _cancel_cell_edit(self):
+        editor = self.cell_editor
+        if editor is None:
+            return
+        self.cell_editor = None
+        editor['entry'].destroy()
+        self.tree.focus_set()
+        return 'break'
+
+    def _next_cell_edit(self):
+        editor = self.cell_editor
+        if editor is None:
+            return
+        iid, col_name = editor['iid'], editor['column']
+        self._commit_cell_edit()
+        if col_name == 'prompt':
+            target_iid, target_col = iid, 'answer'
+        else:
+            target_iid, target_col = self.tree.next(iid), 'prompt'
+        if not target_iid:
+            self.tree.focus_set()
+            return 'break'
+        self.tree.focus(target_iid)
+        self.tree.selection_set(target_iid)
+        self.tree.see(target_iid)
+        self.update_idletasks()
+        x, y, w, h = self.tree.bbox(target_iid, target_col) or (0, 0, 0, 0)
+        fake = type('Event', (), {'type': None, 'x': x + 1, 'y': y + 1})()
+        self._begin_cell_edit(fake)
+        return 'break'
+
+    def _delete_grid_rows(self):
+        rows = [iid for iid in self.tree.selection() if iid in self.row_map]
+        if not rows:
+            return
+        if not messagebox.askyesno('Delete practice items', f'Delete {len(rows)} practice item(s)?'):
+            return
+        # Delete from the end so earlier indexes stay valid
+        targets = sorted((self.row_map[iid] for iid in rows), reverse=True)
+        for lesson_num, idx in targets:
+            record, lesson, fi, li = self._get_lesson_by_number(lesson_num)
+            del lesson['practice'][idx]
+            self._mark_lesson_dirty(lesson_num)
+        self._populate_grid()
+
+    # ---------------------- TSV/CSV bulk edit ----------------------
+    @staticmethod
+    def _parse_rows(text: str, delimiter: str = None):
+        if delimiter is None:
+            delimiter = '\t' if '\t' in text else ','
+        rows = [
+            [cell.strip() for cell in row]
+            for row in csv.reader(io.StringIO(text), delimiter=delimiter)
+            if any(cell.strip() for cell in row)
+        ]
+        if rows and [c.lower() for c in rows[0][:3]] in (['lesson', 'prompt', 'answer'], ['prompt', 'answer']):
+            rows = rows[1:]
+        return rows
+
+    def _rows_to_sets(self, rows, default_lesson=None):
+        # 3 columns: lesson, prompt, answer; 2 columns: prompt, answer for default_lesson
+        sets = {}
+        for line_no, row in enumerate(rows, start=1):
+            # Empty trailing cells (spreadsheet padding) hold no text; anything else extra would be lost
+            while len(row) > 2 and not row[-1]:
+                row = row[:-1]
+            if len(row) > 3:
+                raise ValueError(
+                    f'Row {line_no}: expected at most 3 columns (lesson, prompt, answer), got {len(row)}; '
+                    'quote cells that contain tabs or commas'
+                )
+            if len(row) == 3:
+                try:
+                    lesson_num = int(row[0])
+                except ValueError:
+                    raise ValueError(f'Row {line_no}: lesson number "{row[0]}" is not a number')
+                prompt, answer = row[1], row[2]
+            elif len(row) == 2:
+                if default_lesson is None:
+                    raise ValueError(f'Row {line_no}: no lesson column and no lesson selected')
+                lesson_num = default_lesson
+                prompt, answer = row
+            else:
+                raise ValueError(f'Row {line_no}: expected prompt and answer columns')
+            if lesson_num not in self.index_map:
+                raise ValueError(f'Row {line_no}: lesson {lesson_num} does not exist')
+            sets.setdefault(lesson_num, []).append({'prompt': prompt, 'answer': answer})
+        return sets
+
+    def _replace_practice_sets(self, rows, default_lesson=None):
+        try:
+            sets = self._rows_to_sets(rows, default_lesson)
+        except ValueError as e:
+            messagebox.showerror('Import failed', str(e))
+            return False
+        if not sets:
+            messagebox.showerror('Import failed', 'No practice rows found')
+            return False
+        lessons = ', '.join(str(n) for n in sorted(sets))
+        total = sum(len(v) for v in sets.values())
+        if not messagebox.askyesno('Replace practice sets', f'Replace practice for lesson(s) {lessons} with {total} item(s)?'):
+            return False
+
+        self._commit_cell_edit()
+        if not self.grid_mode:
+            self._sync_item_widgets()
+        for lesson_num, items in sets.items():
+            record, lesson, fi, li = self._get_lesson_by_number(lesson_num)
+            lesson['practice'] = items
+            self._mark_lesson_dirty(lesson_num)
+
+        if self.grid_mode:
+            self._populate_grid()
+            self._grid_show_lesson(min(sets))
+        elif self.current_lesson_num is not None:
+            self._render_practice_editor()
+        return True
+
+    def _paste_rows(self):
+        try:
+            text = self.clipboard_get()
+        except tk.TclError:
+            return 'break'
+        self._replace_practice_sets(self._parse_rows(text), self.current_lesson_num)
+        return 'break'
+
+    def _import_file(self):
+        path = filedialog.askopenfilename(
+            title='Import practice items',
+            filetypes=[('Tab separated', '*.tsv'), ('Comma separated', '*.csv'), ('All files', '*.*')],
+        )
+        if not path:
+            return
+        path = Path(path)
+        try:
+            text = path.read_text(encoding='utf-8-sig')
+        except Exception as e:
+            messagebox.showerror('Import failed', f'Could not read file: {e}')
+            return
+        delimiter = ',' if path.suffix.lower() == '.csv' else '\t'
+        self._replace_practice_sets(self._parse_rows(text, delimiter), self.current_lesson_num)
+
+    def _export_file(self):
+        self._commit_cell_edit()
+        if not self.grid_mode:
+            self._sync_item_widgets()
+        path = filedialog.asksaveasfilename(
+            title='Export practice items',
+            defaultextension='.tsv',
+            filetypes=[('Tab separated', '*.tsv'), ('Comma separated', '*.csv')],
+        )
+        if not path:
+            return
+        path = Path(path)
+        delimiter = ',' if path.suffix.lower() == '.csv' else '\t'
+        try:
+            with path.open('w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f, delimiter=delimiter)
+                writer.writerow(['lesson', 'prompt', 'answer'])
+                for lesson_num in sorted(self.index_map):
+                    record, lesson, fi, li = self._get_lesson_by_number(lesson_num)
+                    for item in lesson.get('practice') or []:
+                        writer.writerow([lesson_num, item.get('prompt', '') or '', item.get('answer', '') or ''])
+        except Exception as e:
+            messagebox.showerror('Export failed', f'Could not write file: {e}')
+            return
+        messagebox.showinfo('Exported', f'Exported practice items to {path.name}')
+
     # ---------------------- Actions ----------------------
     def _add_item(self):
-        if self.current_lesson_num is None:
+        lesson_num = self.current_lesson_num
+        if lesson_num is None:
             return
-        record, lesson, fi, li = self._get_lesson_by_number(self.current_lesson_num)
+        if self.grid_mode:
+            self._commit_cell_edit()
+        else:
+            # Keep typed edits; the list is re-rendered from data below
+            self._sync_item_widgets()
+        record, lesson, fi, li = self._get_lesson_by_number(lesson_num)
         items = lesson.get('practice')
         if not isinstance(items, list):
             items = []
             lesson['practice'] = items
         items.append({'prompt': '', 'answer': ''})
-        self.unsaved_changes = True
+        self._mark_lesson_dirty(lesson_num)
+        if self.grid_mode:
+            self._populate_grid()
+            self._grid_show_lesson(lesson_num)
+            return
         self._render_practice_editor()
         self.after(50, lambda: self.canvas.yview_moveto(1.0))
 
@@ -254,47 +600,79 @@ class PracticeEditorApp(tk.Tk):
             return
         if not messagebox.askyesno('Delete practice item', f'Delete practice item {index + 1}?'):
             return
+        self._sync_item_widgets()
         del items[index]
-        self.unsaved_changes = True
+        self._mark_lesson_dirty(self.current_lesson_num)
         self._render_practice_editor()
 
-    def _reload_current_from_disk(self):
-        if self.current_lesson_num is None:
-            return
-        if self.unsaved_changes and not messagebox.askyesno('Unsaved changes', 'Discard changes and reload from disk?'):
-            return
-        fi, li = self.index_map[self.current_lesson_num]
+    def _has_unsaved(self) -> bool:
+        if self.grid_mode:
+            self._commit_cell_edit()
+        else:
+            self._sync_item_widgets()
+        return bool(self.dirty_files)
+
+    def _reload_file(self, fi: int) -> bool:
         record = self.file_records[fi]
         try:
             with record['path'].open('r', encoding='utf-8') as f:
                 record['data'] = json.load(f)
         except Exception as e:
             messagebox.showerror('Reload failed', f'Could not reload file: {e}')
+            return False
+        self.dirty_files.discard(fi)
+        return True
+
+    def _discard_changes(self) -> bool:
+        # Edits live in the lesson dicts, so discarding means reloading from disk
+        for fi in sorted(self.dirty_files):
+            if not self._reload_file(fi):
+                return False
+        return True
+
+    def _reload_current_from_disk(self):
+        if self.current_lesson_num is None:
+            return
+        fi, li = self.index_map[self.current_lesson_num]
+        if self._has_unsaved() and fi in self.dirty_files:
+            if not messagebox.askyesno('Unsaved changes', 'Discard changes and reload from disk?'):
+                return
+        if not self._reload_file(fi):
+            return
+        if self.grid_mode:
+            self._populate_grid()
+            self._grid_show_lesson(self.current_lesson_num)
             return
-        self.unsaved_changes = False
         self._render_practice_editor()
 
-    def _save(self):
-        if self.current_lesson_num is None:
+    def _sync_item_widgets(self):
+        # Copy list-view Text widgets back into the current lesson's items
+        if self.current_lesson_num is None or not self.item_widgets:
             return
         record, lesson, fi, li = self._get_lesson_by_number(self.current_lesson_num)
         items = lesson.get('practice', None)
         if not isinstance(items, list):
-            # Nothing to save
-            messagebox.showerror('Save failed', 'No practice entries for this lesson')
             return
-
-        # Sync edits back into data
         for i, widgets in enumerate(self.item_widgets):
             if i >= len(items):
                 continue
             item = items[i]
-            prompt_val = widgets['prompt'].get('1.0', 'end-1c').strip()
-            answer_val = widgets['answer'].get('1.0', 'end-1c').strip()
-            item['prompt'] = prompt_val
-            item['answer'] = answer_val
-
-        # Backup
+            try:
+                prompt_val = widgets['prompt'].get('1.0', 'end-1c').strip()
+                answer_val = widgets['answer'].get('1.0', 'end-1c').strip()
+            except tk.TclError:
+                # Widgets already destroyed
+                return
+            # Only a real change marks the file dirty
+            if str(item.get('prompt', '') or '').strip() != prompt_val:
+                item['prompt'] = prompt_val
+                self.dirty_files.add(fi)
+            if str(item.get('answer', '') or '').strip() != answer_val:
+                item['answer'] = answer_val
+                self.dirty_files.add(fi)
+
+    def _write_record(self, record):
+        # Backup, then write. Returns the backup path, or None on failure.
         src = record['path']
         ts = datetime.now().strftime('%Y%m%d-%H%M%S')
         backup_path = self.backup_dir / f"{src.stem}_{ts}.json"
@@ -302,19 +680,56 @@ class PracticeEditorApp(tk.Tk):
             backup_path.write_bytes(src.read_bytes())
         except Exception as e:
             messagebox.showerror('Backup failed', f'Could not create backup copy:\n{backup_path}\n\nError: {e}')
-            return
+            return None
 
-        # Write
         try:
             with src.open('w', encoding='utf-8') as f:
                 json.dump(record['data'], f, ensure_ascii=False, indent=2)
-            self.unsaved_changes = False
-            messagebox.showinfo('Saved', f"Saved to {src.name}\nBackup: backups/{backup_path.name}")
         except Exception as e:
             messagebox.showerror('Save failed', f'Could not write file: {e}')
+            return None
+        return backup_path
+
+    def _save(self):
+        if self.grid_mode:
+            self._commit_cell_edit()
+        else:
+            if self.current_lesson_num is None:
+                return
+            record, lesson, fi, li = self._get_lesson_by_number(self.current_lesson_num)
+            if not isinstance(lesson.get('practice', None), list):
+                # Nothing to save
+                messagebox.showerror('Save failed', 'No practice entries for this lesson')
+                return
+            # Sync edits back into data
+            self._sync_item_widgets()
+
+        if not self.dirty_files:
+            messagebox.showinfo('Saved', 'No changes to save')
+            return
+
+        saved = []
+        for fi in sorted(self.dirty_files):
+            record = self.file_records[fi]
+            backup_path = self._write_record(record)
+            if backup_path is None:
+                return
+            self.dirty_files.discard(fi)
+            saved.append(f"{record['path'].name} (backup: backups/{backup_path.name})")
+
+        self._refresh_site_data()
+        messagebox.showinfo('Saved', 'Saved to\n' + '\n'.join(saved))
+
+    def _refresh_site_data(self):
+        # Keep the dev server's sanitized/derived copies in step with the saved parts
+        try:
+            sanitize_all()
+            build_derived()
+        except Exception as e:
+            messagebox.showwarning('Site data', f'Saved, but could not rebuild the site data:\n{e}')
 
     def _on_quit(self):
-        if self.unsaved_changes:
+        if self._has_unsaved():
             if not messagebox.askyesno('Unsaved changes', 'You have unsaved changes. Quit anyway?'):
                 return
         self.destroy()
@@ -0,0 +1,26 @@
+// Socratic Xhosa - Site data preparation
+// Run: node tools/prepare_data.mjs (npm runs it as predev/prebuild)
+//
+// Runs the Python data builds before `vite` / `vite build`. Many systems only
+// ship `python3`, others (Windows) only `python` or `py`, so use the first one
+// that works; set PYTHON to override.
+
+import { spawnSync } from 'node:child_process';
+
+const SCRIPTS = ['tools/sanitize_data.py', 'tools/build_derived.py'];
+const CANDIDATES = process.env.PYTHON ? [process.env.PYTHON] : ['python3', 'python', 'py'];
+
+const python = CANDIDATES.find(
+  (cmd) => spawnSync(cmd, ['--version'], { stdio: 'ignore' }).status === 0
+);
+if (!python) {
+  console.error(`No Python interpreter found (tried ${CANDIDATES.join(', ')}). Set PYTHON to its path.`);
+  process.exit(1);
+}
+
+for (const script of SCRIPTS) {
+  const result = spawnSync(python, [script], { stdio: 'inherit' });
+  if (result.status !== 0) {
+    process.exit(result.status ?? 1);
+  }
+}
@@ -0,0 +1,243 @@
+# Socratic Xhosa - Offline Text Sanitizer
+# Run: python tools/sanitize_data.py [--force]
+#
+# Writes pre-sanitized copies of the dictionary, texts and lesson parts to
+# public/data/sanitized/ so the web app does not have to clean text on every
+# render. Each cleaned field gets a display version (entities decoded, tags
+# removed, whitespace collapsed, NFC) and, where it is searchable, a
+# `<field>_search` version (casefolded, punctuation dropped).
+#
+# Results are cached per entry hash in tools/.cache/, so reruns only process
+# changed entries. `npm run dev` and `npm run build` run this first; the
+# dictionary, texts and lesson pages read from public/data/sanitized/.
+
+import argparse
+import hashlib
+import html
+import json
+import re
+import unicodedata
+from pathlib import Path
+
+# Bump when the cleaning rules change so cached entries are recomputed
+PIPELINE_VERSION = 3
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT_DIR / 'public' / 'data'
+LESSON_DIR = DATA_DIR / 'lesson_data'
+OUT_DIR = DATA_DIR / 'sanitized'
+# Kept out of public/ so the cache is never deployed with the site
+CACHE_PATH = ROOT_DIR / 'tools' / '.cache' / 'sanitize_cache.json'
+
+NOTE_FILES = ['Xhosa_notes.json', 'Xhosa_texts.json']
+LESSON_FILES = ['part1.json', 'part2.json', 'part3.json', 'part4.json', 'part5.json', 'part6.json']
+
+# Dictionary/texts fields: (field, searchable)
+NOTE_FIELDS = [
+    ('xh', True),
+    ('en', True),
+    ('xh_context', False),
+    ('en_context', True),
+    ('tag', False),
+    ('deck', False),
+]
+
+_TAG_RE = re.compile(r'<[^>]*>?')
+_WS_RE = re.compile(r'\s+')
+_MD_RE = re.compile(r'(\*\*|__|\*|`|^#+\s*)')
+_SEARCH_DROP_RE = re.compile(r"[^\w\s'-]")
+
+
+# ---------------------- Cleaning rules ----------------------
+def decode_entities(text: str) -> str:
+    # Decode entities, then drop any markup
+    return _TAG_RE.sub('', html.unescape(text))
+
+
+def collapse_ws(text: str) -> str:
+    return _WS_RE.sub(' ', text).strip()
+
+
+def strip_md(text: str) -> str:
+    # Titles carry `**bold**` and the odd `*` / heading marker
+    return _MD_RE.sub('', text)
+
+
+def clean_display(text, title: bool = False) -> str:
+    if not text:
+        return ''
+    text = decode_entities(str(text))
+    if title:
+        text = strip_md(text)
+    return unicodedata.normalize('NFC', collapse_ws(text))
+
+
+def clean_search(display: str) -> str:
+    # Curly and straight apostrophes must give the same key (sikelel’ / sikelel')
+    text = _SEARCH_DROP_RE.sub(' ', display.replace('’', "'").casefold())
+    return unicodedata.normalize('NFC', collapse_ws(text))
+
+
+def clean_multiline(text) -> str:
+    # Dialogue is rendered as markdown, so keep line breaks and emphasis
+    if not text:
+        return ''
+    text = html.unescape(str(text)).replace('\xa0', ' ')
+    lines = [re.sub(r'[ \t]+', ' ', line).strip() for line in text.split('\n')]
+    return unicodedata.normalize('NFC', '\n'.join(lines).strip())
+
+
+# ---------------------- Entry transforms ----------------------
+def sanitize_note(entry: dict) -> dict:
+    out = dict(entry)
+    for field, searchable in NOTE_FIELDS:
+        if field not in entry:
+            continue
+        display = clean_display(entry.get(field))
+        out[field] = display
+        if searchable:
+            out[f'{field}_search'] = clean_search(display)
+    return out
+
+
+def sanitize_lesson(lesson: dict) -> dict:
+    out = dict(lesson)
+    title = clean_display(lesson.get('lesson_title') or lesson.get('title'), title=True)
+    out['lesson_title'] = title
+    out['lesson_title_search'] = clean_search(title)
+    objective = clean_display(lesson.get('objective'))
+    out['objective'] = objective
+    out['objective_search'] = clean_search(objective)
+
+    kv = lesson.get('key_vocabulary')
+    if isinstance(kv, list):
+        out['key_vocabulary'] = [
+            {
+                **item,
+                'word': clean_display(item.get('word')),
+                'meaning': clean_display(item.get('meaning')),
+                'word_search': clean_search(clean_display(item.get('word'))),
+            }
+            for item in kv if isinstance(item, dict)
+        ]
+
+    turns = lesson.get('turns')
+    if isinstance(turns, list):
+        new_turns = []
+        for turn in turns:
+            turn = dict(turn)
+            if 'section' in turn:
+                turn['section'] = clean_display(turn['section'], title=True)
+            for key in ('teacher_dialogue', 'student_dialogue'):
+                if key in turn:
+                    turn[key] = clean_multiline(turn[key])
+            new_turns.append(turn)
+        out['turns'] = new_turns
+
+    practice = lesson.get('practice')
+    if isinstance(practice, list):
+        out['practice'] = [
+            {**item, 'prompt': clean_display(item.get('prompt')), 'answer': clean_display(item.get('answer'))}
+            for item in practice if isinstance(item, dict)
+        ]
+    return out
+
+
+# ---------------------- Cache ----------------------
+def entry_hash(kind: str, entry) -> str:
+    payload = json.dumps([PIPELINE_VERSION, kind, entry], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class EntryCache:
+    def __init__(self, path: Path, enabled: bool = True):
+        self.path = path
+        self.old = {}
+        self.new = {}
+        self.hits = 0
+        self.misses = 0
+        if enabled and path.exists():
+            try:
+                with path.open('r', encoding='utf-8') as f:
+                    self.old = json.load(f)
+            except (OSError, ValueError):
+                self.old = {}
+
+    def get(self, kind: str, entry, transform):
+        key = entry_hash(kind, entry)
+        if key in self.new:
+            return self.new[key]
+        if key in self.old:
+            self.hits += 1
+            value = self.old[key]
+        else:
+            self.misses += 1
+            value = transform(entry)
+        self.new[key] = value
+        return value
+
+    def save(self):
+        # Only entries seen in this run are kept, so stale hashes drop out
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open('w', encoding='utf-8') as f:
+            json.dump(self.new, f, ensure_ascii=False)
+
+
+# ---------------------- Pipeline ----------------------
+def _write_json(path: Path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    if path.exists() and path.read_text(encoding='utf-8') == text:
+        return False
+    path.write_text(text, encoding='utf-8')
+    return True
+
+
+def sanitize_all(force: bool = False, out_dir: Path = OUT_DIR, cache_path: Path = CACHE_PATH):
+    cache = EntryCache(cache_path, enabled=not force)
+    written = []
+
+    for fname in NOTE_FILES:
+        src = DATA_DIR / fname
+        if not src.exists():
+            print(f'Missing file: {src}')
+            continue
+        with src.open('r', encoding='utf-8') as f:
+            entries = json.load(f)
+        cleaned = [cache.get('note', e, sanitize_note) for e in entries]
+        if _write_json(out_dir / fname, cleaned):
+            written.append(fname)
+
+    for fname in LESSON_FILES:
+        src = LESSON_DIR / fname
+        if not src.exists():
+            print(f'Missing file: {src}')
+            continue
+        with src.open('r', encoding='utf-8') as f:
+            data = json.load(f)
+        out = dict(data)
+        out['part_name'] = clean_display(data.get('part_name'), title=True)
+        out['lessons'] = [cache.get('lesson', l, sanitize_lesson) for l in data.get('lessons', [])]
+        if _write_json(out_dir / 'lesson_data' / fname, out):
+            written.append(f'lesson_data/{fname}')
+
+    cache.save()
+    return written, cache
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pre-sanitize course data for display and search.')
+    parser.add_argument('--force', action='store_true', help='ignore the cache and reprocess every entry')
+    args = parser.parse_args()
+
+    written, cache = sanitize_all(force=args.force)
+    print(f'Entries: {cache.hits} cached, {cache.misses} processed')
+    if written:
+        for name in written:
+            print(f'Wrote sanitized/{name}')
+    else:
+        print('No output changes')
+
+
+if __name__ == '__main__':
+    main()